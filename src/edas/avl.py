@@ -1,4 +1,5 @@
 from collections import deque
+from array import array
 
 class Node:
     def __init__(self, value):
@@ -7,12 +8,18 @@ class Node:
         self.right = None
         self.parent = None
         self.height = 0  # altura do nó
+        self.size = 1  # quantidade de nós na subárvore
 
     def update_height(self):
         left_height = self.left.height if self.left else -1
         right_height = self.right.height if self.right else -1
         self.height = 1 + max(left_height, right_height)
 
+    def update_size(self):
+        left_size = self.left.size if self.left else 0
+        right_size = self.right.size if self.right else 0
+        self.size = 1 + left_size + right_size
+
     def balance_factor(self):
         left_height = self.left.height if self.left else -1
         right_height = self.right.height if self.right else -1
@@ -23,61 +30,137 @@ class AVLTree:
         self.root = None
         self.size = 0
 
+    @classmethod
+    def from_sorted(cls, iterable, presort=False):
+        """
+        Monta uma árvore perfeitamente balanceada em O(n): o valor do meio
+        de cada trecho vira a raiz dele e as metades viram as subárvores.
+        Uma pilha guarda os trechos pendentes no lugar da recursão, e a
+        altura de cada nó sai direto do tamanho do trecho.
+
+        Args:
+            iterable: Valores em ordem crescente (repetidos são permitidos)
+            presort (bool): Se True, ordena os valores antes de montar
+
+        Raises:
+            ValueError: Se presort for False e os valores não estiverem ordenados.
+        """
+        values = sorted(iterable) if presort else list(iterable)
+        if not presort:
+            for i in range(1, len(values)):
+                if values[i] < values[i - 1]:
+                    raise ValueError(f"Valores fora de ordem: {values[i]} depois de {values[i - 1]}")
+
+        tree = cls()
+        tree.size = len(values)
+        if not values:
+            return tree
+
+        # Cada entrada é um trecho [lo, hi) ainda sem nó, o pai e o lado dele
+        stack = [(0, len(values), None, False)]
+        while stack:
+            lo, hi, parent, is_left = stack.pop()
+            mid = (lo + hi) // 2
+            node = Node(values[mid])
+            node.height = (hi - lo).bit_length() - 1
+            node.size = hi - lo
+            node.parent = parent
+
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            if mid > lo:
+                stack.append((lo, mid, node, True))
+            if hi > mid + 1:
+                stack.append((mid + 1, hi, node, False))
+
+        return tree
+
     def add(self, value):
-        self.root = self._add(self.root, value)
-        self.root.parent = None
+        new_node = Node(value)
         self.size += 1
 
-    def _add(self, node, value):
-        if node is None:
-            return Node(value)
+        if self.root is None:
+            self.root = new_node
+            return
 
-        if value < node.value:
-            node.left = self._add(node.left, value)
-            node.left.parent = node
-        else:
-            node.right = self._add(node.right, value)
-            node.right.parent = node
+        # Desce até a folha onde o valor entra (repetidos vão para a direita),
+        # contando o novo nó em cada subárvore do caminho
+        parent = self.root
+        while True:
+            parent.size += 1
+            if value < parent.value:
+                if parent.left is None:
+                    parent.left = new_node
+                    break
+                parent = parent.left
+            else:
+                if parent.right is None:
+                    parent.right = new_node
+                    break
+                parent = parent.right
 
-        node.update_height()
-        return self._balance(node)
+        new_node.parent = parent
+        self._retrace(parent)
 
     def remove(self, value):
-        if self.root:
-            self.root = self._remove(self.root, value)
-            if self.root:
-                self.root.parent = None
-            self.size -= 1
+        node = self.root
+        while node and node.value != value:
+            node = node.left if value < node.value else node.right
 
-    def _remove(self, node, value):
         if node is None:
-            return None
+            return
 
-        if value < node.value:
-            node.left = self._remove(node.left, value)
-            if node.left:
-                node.left.parent = node
-        elif value > node.value:
-            node.right = self._remove(node.right, value)
-            if node.right:
-                node.right.parent = node
+        if node.left and node.right:
+            # Nó com dois filhos: copia o sucessor e remove o nó dele
+            succ = self._min(node.right)
+            node.value = succ.value
+            node = succ
+
+        # Aqui o nó tem no máximo um filho, que sobe para o lugar dele
+        child = node.left if node.left else node.right
+        parent = node.parent
+        ancestor = parent
+        while ancestor:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+        if child:
+            child.parent = parent
+        self._replace_child(parent, node, child)
+        self.size -= 1
+
+        if parent:
+            self._retrace(parent)
+
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
         else:
-            # Nó encontrado
-            if not node.left:
-                return node.right
-            elif not node.right:
-                return node.left
-            else:
-                # Nó com dois filhos: substitui pelo sucessor
-                succ = self._min(node.right)
-                node.value = succ.value
-                node.right = self._remove(node.right, succ.value)
-                if node.right:
-                    node.right.parent = node
+            parent.right = new
+
+    def _retrace(self, node):
+        """
+        Sobe a partir de node atualizando alturas e balanceando. Para assim
+        que uma subárvore termina com a mesma altura de antes, porque dali
+        para cima nada mudou: na inserção isso acontece no máximo depois
+        de uma rotação, na remoção pode seguir até a raiz.
+        """
+        while node:
+            parent = node.parent
+            old_height = node.height
+            node.update_height()
+            subtree = self._balance(node)
+            self._replace_child(parent, node, subtree)
+            if subtree.height == old_height:
+                return
+            node = parent
 
-        node.update_height()
-        return self._balance(node)
-    
     def _balance(self, node):
         bf = node.balance_factor()
         # Rotação direita
@@ -111,6 +194,8 @@ class AVLTree:
 
         z.update_height()
         y.update_height()
+        z.update_size()
+        y.update_size()
         return y
 
     def _rotate_right(self, z):
@@ -126,6 +211,8 @@ class AVLTree:
 
         z.update_height()
         y.update_height()
+        z.update_size()
+        y.update_size()
         return y
 
     def _min(self, node):
@@ -145,17 +232,384 @@ class AVLTree:
         return self._max(self.root) if self.root else None
 
     def search(self, value):
-        return self._search(self.root, value)
+        node = self.root
+        while node:
+            if node.value == value:
+                return node
+            node = node.left if value < node.value else node.right
+        return None
 
-    def _search(self, node, value):
-        if not node:
+    # ------------------ Estatísticas de ordem ------------------
+    def _rank(self, value, inclusive=False):
+        node = self.root
+        rank = 0
+        while node:
+            if value < node.value or (value == node.value and not inclusive):
+                node = node.left
+            else:
+                rank += (node.left.size if node.left else 0) + 1
+                node = node.right
+        return rank
+
+    def rank(self, value):
+        """Quantidade de valores estritamente menores que value, em O(log n)."""
+        return self._rank(value)
+
+    def select(self, k):
+        """
+        Retorna o k-ésimo menor valor (a partir de 0) em O(log n), descendo
+        guiado pelo tamanho das subárvores da esquerda.
+
+        Raises:
+            IndexError: Se k estiver fora da árvore.
+        """
+        if k < 0 or k >= self.size:
+            raise IndexError("Posição fora da árvore")
+
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo, hi):
+        """Quantidade de valores no intervalo fechado [lo, hi], em O(log n)."""
+        if lo > hi:
+            return 0
+        return self._rank(hi, inclusive=True) - self._rank(lo)
+
+    def median(self):
+        """Mediana (a menor das duas do meio quando o tamanho é par), ou None se vazia."""
+        if self.root is None:
             return None
-        if node.value == value:
+        return self.select((self.size - 1) // 2)
+
+    # ------------------ Join / Split ------------------
+    def _fix_up(self, node):
+        """
+        Sobe de node até a raiz da árvore dele atualizando altura e tamanho
+        e balanceando no caminho. Retorna a raiz.
+        """
+        while True:
+            parent = node.parent
+            node.update_height()
+            node.update_size()
+            subtree = self._balance(node)
+            if parent is None:
+                return subtree
+            if parent.left is node:
+                parent.left = subtree
+            else:
+                parent.right = subtree
+            node = parent
+
+    def _join(self, left, node, right):
+        """
+        Liga as subárvores left e right por node (tudo em left <= node.value
+        <= tudo em right) e retorna a raiz. A mais baixa é pendurada na borda
+        da mais alta, no primeiro nó de altura parecida, e só esse caminho é
+        rebalanceado: O(|altura(left) - altura(right)| + 1).
+        """
+        if left:
+            left.parent = None
+        if right:
+            right.parent = None
+        left_height = left.height if left else -1
+        right_height = right.height if right else -1
+
+        parent = None
+        if left_height > right_height + 1:
+            # Desce pela borda direita de left até uma altura <= a de right + 1
+            spine = left
+            while spine and spine.height > right_height + 1:
+                parent = spine
+                spine = spine.right
+            left = spine
+        elif right_height > left_height + 1:
+            spine = right
+            while spine and spine.height > left_height + 1:
+                parent = spine
+                spine = spine.left
+            right = spine
+
+        node.left = left
+        node.right = right
+        node.parent = parent
+        if left:
+            left.parent = node
+        if right:
+            right.parent = node
+        node.update_height()
+        node.update_size()
+
+        if parent is None:
             return node
-        elif value < node.value:
-            return self._search(node.left, value)
+        if left_height > right_height:
+            parent.right = node
+        else:
+            parent.left = node
+        return self._fix_up(parent)
+
+    def _join2(self, left, right):
+        """Liga duas subárvores sem nó do meio, usando o maior nó de left."""
+        if left is None:
+            return right
+        if right is None:
+            left.parent = None
+            return left
+
+        node = left
+        while node.right:
+            node = node.right
+        parent = node.parent
+        child = node.left
+        if child:
+            child.parent = parent
+        if parent is None:
+            left = child
+        else:
+            parent.right = child
+            left = self._fix_up(parent)
+        return self._join(left, node, right)
+
+    def _split(self, root, value, keep_equal=False):
+        """
+        Corta a subárvore de root em value com uma descida, juntando de baixo
+        para cima os pedaços que ficaram de cada lado. Retorna (menores,
+        nó igual a value ou None, maiores). Com keep_equal não para no
+        primeiro igual: todos os iguais vão para a direita.
+        """
+        path = []
+        middle = None
+        node = root
+        while node:
+            if node.value == value and not keep_equal:
+                middle = node
+                break
+            goes_left = value <= node.value if keep_equal else value < node.value
+            path.append((node, goes_left))
+            node = node.left if goes_left else node.right
+
+        left = right = None
+        if middle:
+            left, right = middle.left, middle.right
+            if left:
+                left.parent = None
+            if right:
+                right.parent = None
+            middle.left = middle.right = middle.parent = None
+            middle.height = 0
+            middle.size = 1
+
+        # Quem desceu para a esquerda fica à direita do corte, com a subárvore direita
+        for node, goes_left in reversed(path):
+            if goes_left:
+                right = self._join(right, node, node.right)
+            else:
+                left = self._join(node.left, node, left)
+
+        return left, middle, right
+
+    def _from_root(self, root):
+        tree = type(self)()
+        tree.root = root
+        tree.size = root.size if root else 0
+        return tree
+
+    def join(self, other, right=None):
+        """
+        Com um argumento, concatena other no fim desta árvore, como a
+        SkipList.join: todos os valores de other precisam ser >= aos daqui e
+        o maior nó desta árvore liga as duas.
+
+        Com dois, é a junção de três vias join(left, value, right) das
+        operações de conjunto: other é o valor do meio, que vira um nó novo
+        entre esta árvore (valores <= other) e right (valores >= other). Pode
+        ser chamada também como AVLTree.join(left, value, right).
+
+        Os dois casos custam O(log n). Os nós da árvore da direita passam
+        para esta, que é retornada, e a da direita fica vazia.
+
+        Raises:
+            ValueError: Se os valores não estiverem em ordem.
+        """
+        node = None
+        if right is None:
+            right = other
+        else:
+            node = Node(other)
+        low = self._max(self.root).value if self.root else None
+        high = right._min(right.root).value if right.root else None
+        if node is not None:
+            if ((low is not None and low > node.value) or
+                    (high is not None and node.value > high)):
+                raise ValueError("join precisa que left <= value <= right")
+            self.root = self._join(self.root, node, right.root)
+            self.size += 1
         else:
-            return self._search(node.right, value)
+            if low is not None and high is not None and low > high:
+                raise ValueError("join precisa que os valores de other sejam >= aos desta árvore")
+            self.root = self._join2(self.root, right.root)
+
+        self.size += right.size
+        right.root = None
+        right.size = 0
+        return self
+
+    def split(self, value):
+        """
+        Divide a árvore em duas em O(log n): a dos valores menores que value
+        e a dos maiores ou iguais. Os nós passam para as novas árvores e
+        esta fica vazia, como na SkipList.split.
+        """
+        left, _, right = self._split(self.root, value, keep_equal=True)
+        self.root = None
+        self.size = 0
+        return self._from_root(left), self._from_root(right)
+
+    # ------------------ Operações de conjunto ------------------
+    # As versões *_update alteram só esta árvore e apenas leem other. Com
+    # tamanhos parecidos, union_update e difference_update cortam esta árvore
+    # com um _split em cada nó de other e resolvem os dois lados
+    # separadamente, O(m log(n/m + 1)) para |other| = m; intersection_update
+    # refaz a árvore pelo merge em ordem, que nessa faixa custa o mesmo
+    # O(n + m) e não precisa dos _split. Quando uma das árvores tem até
+    # 1/_PER_VALUE_RATIO do tamanho da outra, um add/remove/search por valor
+    # da menor sai mais barato e é usado no lugar. union/intersection/
+    # difference não alteram nenhuma das duas: como os nós guardam parent,
+    # uma subárvore não pode estar em duas árvores, e o resultado é montado
+    # com nós próprios pelo merge em ordem, O(n + m), ou pelo mesmo caminho
+    # por valor. Pensadas para árvores sem valores repetidos.
+    _PER_VALUE_RATIO = 2
+
+    def _merge(self, other, keep_left, keep_both, keep_right):
+        """Gera em ordem os valores escolhidos do merge das duas árvores."""
+        left = self.iter_inorder()
+        right = other.iter_inorder()
+        a = next(left, None)
+        b = next(right, None)
+        while a is not None and b is not None:
+            if a < b:
+                if keep_left:
+                    yield a
+                a = next(left, None)
+            elif b < a:
+                if keep_right:
+                    yield b
+                b = next(right, None)
+            else:
+                if keep_both:
+                    yield a
+                a = next(left, None)
+                b = next(right, None)
+        while keep_left and a is not None:
+            yield a
+            a = next(left, None)
+        while keep_right and b is not None:
+            yield b
+            b = next(right, None)
+
+    def _add_missing(self, other):
+        for value in other:
+            if self.search(value) is None:
+                self.add(value)
+
+    def _remove_each(self, other):
+        for value in other:
+            self.remove(value)
+
+    def _replace_with(self, tree):
+        self.root = tree.root
+        self.size = tree.size
+
+    def union(self, other):
+        """Nova árvore com os valores das duas."""
+        if other.size * self._PER_VALUE_RATIO <= self.size:
+            result = self.copy()
+            result._add_missing(other)
+            return result
+        if self.size * self._PER_VALUE_RATIO <= other.size:
+            result = other.copy()
+            result._add_missing(self)
+            return result
+        return type(self).from_sorted(self._merge(other, True, True, True))
+
+    def intersection(self, other):
+        """Nova árvore com os valores presentes nas duas."""
+        small, big = (other, self) if other.size <= self.size else (self, other)
+        if small.size * self._PER_VALUE_RATIO <= big.size:
+            return type(self).from_sorted(value for value in small if big.search(value) is not None)
+        return type(self).from_sorted(self._merge(other, False, True, False))
+
+    def difference(self, other):
+        """Nova árvore com os valores desta que não estão em other."""
+        if other.size * self._PER_VALUE_RATIO <= self.size:
+            result = self.copy()
+            result._remove_each(other)
+            return result
+        if self.size * self._PER_VALUE_RATIO <= other.size:
+            return type(self).from_sorted(value for value in self if other.search(value) is None)
+        return type(self).from_sorted(self._merge(other, True, False, False))
+
+    def _union(self, a, b):
+        if b is None:
+            return a
+        if a is None:
+            return self._copy_node(b)
+        left_a, middle, right_a = self._split(a, b.value)
+        left = self._union(left_a, b.left)
+        right = self._union(right_a, b.right)
+        return self._join(left, middle or Node(b.value), right)
+
+    def _difference(self, a, b):
+        if a is None:
+            return None
+        if b is None:
+            return a
+        left_a, _, right_a = self._split(a, b.value)
+        left = self._difference(left_a, b.left)
+        right = self._difference(right_a, b.right)
+        return self._join2(left, right)
+
+    def _update(self, operation, other):
+        if other is self:
+            other = self.copy()
+        root = operation(self.root, other.root)
+        if root:
+            root.parent = None
+        self.root = root
+        self.size = root.size if root else 0
+
+    def union_update(self, other):
+        """Acrescenta a esta árvore os valores de other (other não muda)."""
+        if other.size * self._PER_VALUE_RATIO <= self.size:
+            self._add_missing(other)
+        else:
+            self._update(self._union, other)
+
+    def intersection_update(self, other):
+        """Mantém nesta árvore só os valores que também estão em other (other não muda)."""
+        small, big = (other, self) if other.size <= self.size else (self, other)
+        if small.size * self._PER_VALUE_RATIO <= big.size:
+            self._replace_with(type(self).from_sorted(
+                value for value in small if big.search(value) is not None))
+        else:
+            self._replace_with(type(self).from_sorted(self._merge(other, False, True, False)))
+
+    def difference_update(self, other):
+        """Tira desta árvore os valores que estão em other (other não muda)."""
+        if other.size * self._PER_VALUE_RATIO <= self.size:
+            self._remove_each(other)
+        elif self.size * self._PER_VALUE_RATIO <= other.size:
+            self._replace_with(type(self).from_sorted(
+                value for value in self if other.search(value) is None))
+        else:
+            self._update(self._difference, other)
 
     # ------------------ Predecessor / Sucessor ------------------
     def predecessor(self, node):
@@ -177,14 +631,57 @@ class AVLTree:
         return parent
 
     # ------------------ Percursos ------------------
-    def in_order(self):
-        self._in_order(self.root)
+    def iter_inorder(self):
+        """Gera os valores em ordem crescente com uma pilha do tamanho da altura."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
 
-    def _in_order(self, node):
-        if node:
-            self._in_order(node.left)
-            print(node.value)
-            self._in_order(node.right)
+    def iter_reverse(self):
+        """Gera os valores em ordem decrescente com uma pilha do tamanho da altura."""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.value
+            node = node.left
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    def range(self, lo, hi):
+        """
+        Gera os valores do intervalo fechado [lo, hi] em ordem crescente.
+        Uma descida acha o primeiro nó >= lo e dali o percurso segue pelo
+        sucessor, usando os ponteiros parent: O(log n + k) de tempo e
+        memória constante.
+        """
+        node = self.root
+        first = None
+        while node:
+            if node.value >= lo:
+                first = node
+                node = node.left
+            else:
+                node = node.right
+
+        node = first
+        while node and node.value <= hi:
+            yield node.value
+            node = self.sucessor(node)
+
+    def in_order(self):
+        for value in self.iter_inorder():
+            print(value)
 
     def pre_order(self):
         self._pre_order(self.root)
@@ -225,7 +722,7 @@ class AVLTree:
         Cria uma cópia profunda da árvore AVL.
         Retorna uma nova instância de AVLTree com os mesmos valores.
         """
-        new_tree = AVLTree()
+        new_tree = type(self)()
         if self.root:
             new_tree.root = self._copy_node(self.root)
             new_tree.size = self.size
@@ -243,6 +740,7 @@ class AVLTree:
         # Cria um novo nó com o mesmo valor
         new_node = Node(node.value)
         new_node.height = node.height
+        new_node.size = node.size
         
         # Copia recursivamente os filhos
         new_node.left = self._copy_node(node.left)
@@ -268,15 +766,205 @@ class AVLTree:
 
     def to_list(self):
         """Converte a árvore em uma lista ordenada (in-order)"""
-        result = []
-        self._to_list(self.root, result)
-        return result
+        return list(self.iter_inorder())
 
-    def _to_list(self, node, result):
-        if node:
-            self._to_list(node.left, result)
-            result.append(node.value)
-            self._to_list(node.right, result)
+
+class CompactAVLTree:
+    """
+    AVL com os nós guardados em colunas paralelas de array, em vez de um
+    objeto Node por valor: cada nó é um índice, os filhos e o pai são
+    índices e o índice 0 faz o papel de None (altura -1). Slots de nós
+    removidos entram numa lista livre, encadeada pela coluna right, e são
+    reaproveitados pelo add. Só guarda inteiros que cabem em 64 bits.
+    """
+
+    def __init__(self):
+        self.values = array('q', [0])
+        self.left = array('i', [0])
+        self.right = array('i', [0])
+        self.parent = array('i', [0])
+        self.heights = array('b', [-1])
+        self.root = 0
+        self.size = 0
+        self._free = 0  # primeiro slot livre (0 quando não há)
+
+    def _new_node(self, value):
+        index = self._free
+        if index:
+            self._free = self.right[index]
+            self.values[index] = value
+            self.left[index] = self.right[index] = self.parent[index] = 0
+            self.heights[index] = 0
+            return index
+
+        self.values.append(value)
+        self.left.append(0)
+        self.right.append(0)
+        self.parent.append(0)
+        self.heights.append(0)
+        return len(self.values) - 1
+
+    def _update_height(self, node):
+        heights = self.heights
+        left_height = heights[self.left[node]]
+        right_height = heights[self.right[node]]
+        heights[node] = 1 + (left_height if left_height > right_height else right_height)
+
+    def _balance_factor(self, node):
+        return self.heights[self.left[node]] - self.heights[self.right[node]]
+
+    def _rotate_left(self, z):
+        left, right, parent = self.left, self.right, self.parent
+        y = right[z]
+        t2 = left[y]
+
+        left[y] = z
+        parent[y] = parent[z]
+        parent[z] = y
+        right[z] = t2
+        if t2:
+            parent[t2] = z
+
+        self._update_height(z)
+        self._update_height(y)
+        return y
+
+    def _rotate_right(self, z):
+        left, right, parent = self.left, self.right, self.parent
+        y = left[z]
+        t3 = right[y]
+
+        right[y] = z
+        parent[y] = parent[z]
+        parent[z] = y
+        left[z] = t3
+        if t3:
+            parent[t3] = z
+
+        self._update_height(z)
+        self._update_height(y)
+        return y
+
+    def _balance(self, node):
+        bf = self._balance_factor(node)
+        if bf > 1:
+            if self._balance_factor(self.left[node]) < 0:
+                self.left[node] = self._rotate_left(self.left[node])
+            return self._rotate_right(node)
+        if bf < -1:
+            if self._balance_factor(self.right[node]) > 0:
+                self.right[node] = self._rotate_right(self.right[node])
+            return self._rotate_left(node)
+        return node
+
+    def _replace_child(self, parent, old, new):
+        if parent == 0:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def _retrace(self, node):
+        # Mesma regra da AVLTree: para quando a altura da subárvore não muda
+        heights, parent = self.heights, self.parent
+        while node:
+            above = parent[node]
+            old_height = heights[node]
+            self._update_height(node)
+            subtree = self._balance(node)
+            self._replace_child(above, node, subtree)
+            if heights[subtree] == old_height:
+                return
+            node = above
+
+    def add(self, value):
+        new_node = self._new_node(value)
+        self.size += 1
+
+        if self.root == 0:
+            self.root = new_node
+            return
+
+        values, left, right = self.values, self.left, self.right
+        node = self.root
+        while True:
+            if value < values[node]:
+                if left[node] == 0:
+                    left[node] = new_node
+                    break
+                node = left[node]
+            else:
+                if right[node] == 0:
+                    right[node] = new_node
+                    break
+                node = right[node]
+
+        self.parent[new_node] = node
+        self._retrace(node)
+
+    def search(self, value):
+        """Retorna o índice do nó com value (sempre maior que 0) ou None."""
+        values, left, right = self.values, self.left, self.right
+        node = self.root
+        while node:
+            current = values[node]
+            if current == value:
+                return node
+            node = left[node] if value < current else right[node]
+        return None
+
+    def remove(self, value):
+        node = self.search(value)
+        if node is None:
+            return
+
+        left, right, parent = self.left, self.right, self.parent
+        if left[node] and right[node]:
+            # Dois filhos: copia o sucessor e remove o slot dele
+            succ = right[node]
+            while left[succ]:
+                succ = left[succ]
+            self.values[node] = self.values[succ]
+            node = succ
+
+        child = left[node] or right[node]
+        above = parent[node]
+        if child:
+            parent[child] = above
+        self._replace_child(above, node, child)
+        self.size -= 1
+
+        right[node] = self._free
+        self._free = node
+
+        if above:
+            self._retrace(above)
+
+    def __iter__(self):
+        """Gera os valores em ordem crescente com uma pilha do tamanho da altura."""
+        values, left, right = self.values, self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield values[node]
+            node = right[node]
+
+    def to_list(self):
+        return list(self)
+
+    def height(self):
+        return self.heights[self.root]
+
+    def is_empty(self):
+        return self.root == 0
+
+    def size_tree(self):
+        return self.size
 
 
 if __name__ == "__main__":
@@ -358,4 +1046,46 @@ if __name__ == "__main__":
     print(f"Árvore 3 (cópia + 200): {tree3.bfs()}")
     print(f"Árvore 4 (cópia da cópia + 300): {tree4.bfs()}")
     
+    print()
+
+    # Teste 8: split e join conferidos contra a lista esperada
+    print("8. Testando split e join:")
+
+    def balanceada(node):
+        """Confere altura, tamanho, fator de balanço e parent de cada nó."""
+        if node is None:
+            return True
+        for child in (node.left, node.right):
+            if child and child.parent is not node:
+                return False
+        left_height = node.left.height if node.left else -1
+        right_height = node.right.height if node.right else -1
+        left_size = node.left.size if node.left else 0
+        right_size = node.right.size if node.right else 0
+        return (node.height == 1 + max(left_height, right_height) and
+                node.size == 1 + left_size + right_size and
+                abs(left_height - right_height) <= 1 and
+                balanceada(node.left) and balanceada(node.right))
+
+    tree5 = AVLTree()
+    for valor in range(1, 41):
+        tree5.add(valor)
+    menores, maiores = tree5.split(15)
+    split_ok = (menores.to_list() == list(range(1, 15)) and
+                maiores.to_list() == list(range(15, 41)) and
+                balanceada(menores.root) and balanceada(maiores.root))
+    print(f"split(15) - Menores: {menores.size}, Maiores: {maiores.size}, Correto: {split_ok}")
+
+    menores.join(maiores)
+    join_ok = (menores.to_list() == list(range(1, 41)) and maiores.size == 0 and
+               balanceada(menores.root))
+    print(f"join de volta - Tamanho: {menores.size}, Correto: {join_ok}")
+
+    direita = AVLTree.from_sorted(range(100, 400))
+    AVLTree.join(menores, 50, direita)
+    join3_ok = (menores.to_list() == list(range(1, 41)) + [50] + list(range(100, 400)) and
+                direita.size == 0 and balanceada(menores.root))
+    print(f"join(left, 50, right) - Tamanho: {menores.size}, Correto: {join3_ok}")
+    print(f"Split e join passaram: {split_ok and join_ok and join3_ok}")
+
     print("\n=== Todos os testes concluídos! ===")
\ No newline at end of file
@@ -0,0 +1,309 @@
+from typing import Optional, List, Any, Iterator, Tuple
+from random import Random
+import threading
+import itertools
+
+from src.edas.skiplist import GeometricLevels
+
+
+class Node:
+    """
+    Node da skiplist concorrente. Além do par chave valor e do forward,
+    carrega o próprio lock e duas marcas: marked (remoção lógica já feita)
+    e fully_linked (todos os levels já foram ligados).
+    """
+
+    def __init__(self, key: Any, value: Any, top_level: int):
+        """
+        Args:
+            key (Any): Chave que identifica o node (os sentinelas usam ±inf)
+            value (Any): Valor do node
+            top_level (int): Maior level em que o node aparece
+        """
+        self.key = key
+        self.value = value
+        self.top_level = top_level
+        self.forward: List[Optional['Node']] = [None] * (top_level + 1)
+        self.lock = threading.Lock()
+        self.marked = False
+        self.fully_linked = False
+
+
+class ConcurrentSkipList:
+    """
+    Skiplist segura para várias threads, no estilo da lazy skiplist
+    (Herlihy, Lev, Luchangco e Shavit): escritores travam só os
+    predecessores de cada level e validam que nada mudou antes de religar;
+    leitores nunca travam, só percorrem os ponteiros e olham as marcas.
+    A remoção é lógica (marked) antes de ser física, então um leitor
+    sempre enxerga um estado consistente.
+        - Pesquisa O(log n), sem locks
+        - Inserção O(log n), locks só nos predecessores
+        - Deleção O(log n), locks no alvo e nos predecessores
+    """
+
+    def __init__(self, max_level: int = 20, p: float = 0.5, seed: Optional[int] = None):
+        """
+        Args:
+            max_level (int): O número máximo de levels da estrutura (default 20)
+            p (float): O fator aleatório que promove um nível (default 0.5)
+            seed (Optional[int]): Seed dos geradores de levels, combinada com o
+                número de cada thread (default None)
+        """
+        self.max_level = max_level
+        self.p = p
+        self.seed = seed
+        self._local = threading.local() # sorteio de levels de cada thread
+        self._thread_ids = itertools.count() # next() é atômico no CPython
+
+        self.header = Node(float("-inf"), None, max_level)
+        self.tail = Node(float("inf"), None, max_level)
+        for i in range(max_level + 1):
+            self.header.forward[i] = self.tail
+        self.header.fully_linked = self.tail.fully_linked = True
+
+    def _random_level(self) -> int:
+        """
+        Gera o level de um novo node. Cada thread tem o próprio gerador,
+        então os escritores não disputam nenhum lock aqui.
+        """
+        try:
+            draw = self._local.draw
+        except AttributeError:
+            # O get_ident é reaproveitado quando uma thread termina, então
+            # cada thread que chega aqui recebe um número novo
+            thread_id = next(self._thread_ids)
+            seed = None if self.seed is None else f"{self.seed}:{thread_id}"
+            generator = GeometricLevels(self.p, Random(seed))
+            draw = self._local.draw = generator.bind(self.max_level)
+        return draw()
+
+    def _find(self, key: Any, preds: List[Node], succs: List[Node]) -> int:
+        """
+        Percorre a estrutura sem travar nada, preenchendo os predecessores
+        e sucessores de key em cada level.
+
+        Returns:
+            int: O maior level em que key foi encontrada, ou -1.
+        """
+        found = -1
+        pred = self.header
+
+        for level in range(self.max_level, -1, -1):
+            current = pred.forward[level]
+            while key > current.key:
+                pred = current
+                current = pred.forward[level]
+            if found == -1 and key == current.key:
+                found = level
+            preds[level] = pred
+            succs[level] = current
+
+        return found
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Procura uma chave sem pegar nenhum lock.
+
+        Args:
+            key (Any): A chave que está sendo pesquisada.
+
+        Returns:
+            O valor associado a chave indicada, ou None.
+        """
+        pred = self.header
+
+        for level in range(self.max_level, -1, -1):
+            current = pred.forward[level]
+            while key > current.key:
+                pred = current
+                current = pred.forward[level]
+
+        if current.key == key and current.fully_linked and not current.marked:
+            return current.value
+        return None
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if key exists in skiplist."""
+        return self.search(key) is not None
+
+    def insert(self, key: Any, value: Any) -> bool:
+        """
+        Insere o par chave valor. Se a chave já existe, só troca o valor.
+
+        Args:
+            key (Any): Chave que identifica o nó
+            value (Any): Valor atribuído ao nó
+
+        Returns:
+            bool: True se um node novo foi criado.
+        """
+        top_level = self._random_level()
+        preds: List[Node] = [self.header] * (self.max_level + 1)
+        succs: List[Node] = [self.tail] * (self.max_level + 1)
+
+        while True:
+            found = self._find(key, preds, succs)
+            if found != -1:
+                node = succs[found]
+                if not node.marked:
+                    # Espera quem está inserindo terminar de ligar o node
+                    while not node.fully_linked:
+                        pass
+                    node.value = value
+                    return False
+                # O node está saindo, tenta de novo
+                continue
+
+            locked = []
+            try:
+                valid = True
+                previous = None
+                for level in range(top_level + 1):
+                    pred = preds[level]
+                    succ = succs[level]
+                    if pred is not previous:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                        previous = pred
+                    valid = (not pred.marked and not succ.marked and
+                             pred.forward[level] is succ)
+                    if not valid:
+                        break
+
+                if not valid:
+                    continue
+
+                new_node = Node(key, value, top_level)
+                for level in range(top_level + 1):
+                    new_node.forward[level] = succs[level]
+                for level in range(top_level + 1):
+                    preds[level].forward[level] = new_node
+
+                new_node.fully_linked = True
+                return True
+            finally:
+                for node in locked:
+                    node.lock.release()
+
+    def delete(self, key: Any) -> bool:
+        """
+        Remove uma chave: primeiro marca o node (remoção lógica) e depois
+        religa os predecessores, validando cada um sob lock.
+
+        Args:
+            key (Any): Chave que identifica o elemento a ser deletado.
+
+        Returns:
+            Retorna se conseguiu achar/deletar o nó com a chave indicada.
+        """
+        victim = None
+        is_marked = False
+        top_level = -1
+        preds: List[Node] = [self.header] * (self.max_level + 1)
+        succs: List[Node] = [self.tail] * (self.max_level + 1)
+
+        while True:
+            found = self._find(key, preds, succs)
+            if found != -1:
+                victim = succs[found]
+
+            if not is_marked and not (found != -1 and victim.fully_linked and
+                                      victim.top_level == found and not victim.marked):
+                return False
+
+            if not is_marked:
+                top_level = victim.top_level
+                victim.lock.acquire()
+                if victim.marked:
+                    victim.lock.release()
+                    return False
+                victim.marked = True
+                is_marked = True
+
+            locked = []
+            try:
+                valid = True
+                previous = None
+                for level in range(top_level + 1):
+                    pred = preds[level]
+                    if pred is not previous:
+                        pred.lock.acquire()
+                        locked.append(pred)
+                        previous = pred
+                    valid = not pred.marked and pred.forward[level] is victim
+                    if not valid:
+                        break
+
+                if not valid:
+                    continue
+
+                for level in range(top_level, -1, -1):
+                    preds[level].forward[level] = victim.forward[level]
+
+                victim.lock.release()
+                return True
+            finally:
+                for node in locked:
+                    node.lock.release()
+
+    def range(self, lo: Any, hi: Any) -> Iterator[Tuple[Any, Any]]:
+        """
+        Percorre os pares do intervalo fechado [lo, hi] sem travar,
+        pulando os nodes que já foram removidos logicamente.
+        """
+        pred = self.header
+
+        for level in range(self.max_level, -1, -1):
+            current = pred.forward[level]
+            while lo > current.key:
+                pred = current
+                current = pred.forward[level]
+
+        while current is not self.tail and current.key <= hi:
+            if current.fully_linked and not current.marked:
+                yield current.key, current.value
+            current = current.forward[0]
+
+    def items(self) -> List[tuple]:
+        """Return a snapshot of the key-value pairs in sorted order."""
+        items = []
+        current = self.header.forward[0]
+        while current is not self.tail:
+            if current.fully_linked and not current.marked:
+                items.append((current.key, current.value))
+            current = current.forward[0]
+        return items
+
+    def keys(self) -> List[Any]:
+        """Return a snapshot of the keys in sorted order."""
+        return [key for key, _ in self.items()]
+
+    def __len__(self) -> int:
+        """Return the number of elements (O(n), consistente só sem escritas em paralelo)."""
+        return len(self.items())
+
+
+if __name__ == "__main__":
+    csl = ConcurrentSkipList(seed=1)
+    num_threads = 4
+    per_thread = 2500
+
+    def writer(offset: int) -> None:
+        for key in range(offset, num_threads * per_thread, num_threads):
+            csl.insert(key, key)
+        for key in range(offset, num_threads * per_thread, 2 * num_threads):
+            csl.delete(key)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    keys = csl.keys()
+    expected = [k for k in range(num_threads * per_thread) if k % (2 * num_threads) >= num_threads]
+    print(f"Size: {len(csl)}")
+    print(f"Ordered: {keys == sorted(keys)}")
+    print(f"Matches expected: {keys == expected}")
+    print(f"Range [100, 120]: {list(csl.range(100, 120))}")
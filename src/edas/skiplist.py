@@ -1,5 +1,8 @@
-from typing import Optional, List, Any
-from random import random
+from typing import Optional, List, Any, Callable, Iterable, Iterator, Tuple
+from random import Random
+from math import log
+from collections import OrderedDict
+from functools import lru_cache
 import sys
 
 class Node:
@@ -10,7 +13,7 @@ class Node:
     para próximo do Node que você deseja.
     """
 
-    def __init__(self, key: int, value: Any, level: int = 1):
+    def __init__(self, key: int, value: Any, level: int = 1, indexable: bool = True):
         """
         Inicializa os valores, limitados a inteiros para chave e valor.
 
@@ -18,13 +21,116 @@ class Node:
             key (int): Chave que identifica o node
             value (Any): Valor do node
             level (int): Tamanho de layers que podem ser atribuídos ao Node
+            indexable (bool): Se False, o Node não guarda larguras (default True)
         """
         self.key = key
         self.value = value
         self.forward: List[Optional['Node']] = [None] * level
+        # Quantos elementos cada ponteiro do forward pula (0 quando aponta pra None)
+        self.width: Optional[List[int]] = [0] * level if indexable else None
+        # Node anterior no level 0 (None no primeiro), para andar para trás
+        self.backward: Optional['Node'] = None
 
 
 
+@lru_cache(maxsize=None)
+def _level_table(bits: int, levels: int) -> Tuple[int, ...]:
+    """
+    Tabela de levels indexada por uma palavra de bits * levels bits: cada
+    entrada é a quantidade de grupos de bits zerados no fim da palavra. A
+    palavra toda zerada mapeia para levels. É compartilhada entre as
+    SkipLists com a mesma configuração.
+    """
+    table = [levels] * (1 << (bits * levels))
+    for word in range(1, len(table)):
+        table[word] = ((word & -word).bit_length() - 1) // bits
+    return tuple(table)
+
+
+class GeometricLevels:
+    """
+    Gerador padrão de levels, com distribuição geométrica P(level >= i) = p^i.
+    Em vez de sortear uma vez por level promovido, cada chamada faz um único
+    sorteio: quando 1/p é potência de 2 consulta numa tabela os zeros no fim
+    de uma palavra do getrandbits, senão inverte a distribuição com um log.
+    Quem sorteia sempre com o mesmo teto pode pegar o sorteio já preso a ele
+    com bind(max_level), sem passar o teto a cada chamada.
+    """
+
+    def __init__(self, p: float, rng: Random):
+        """
+        Args:
+            p (float): Probabilidade de promover um level
+            rng (Random): Fonte de aleatoriedade (permite fixar a seed)
+        """
+        self.p = p
+        self.rng = rng
+        self._getrandbits = rng.getrandbits
+        self._log_p = log(p)
+        inverse = round(1 / p)
+        # Bits por level quando p = 1/2^k, 0 se não for o caso
+        self._bits = (inverse.bit_length() - 1
+                      if inverse > 1 and inverse & (inverse - 1) == 0 and
+                      abs(1 / inverse - p) < 1e-12 else 0)
+        self._draw = self.bind(0)
+
+    def bind(self, max_level: int) -> Callable[[], int]:
+        """
+        Prende o teto em max_level e retorna o sorteio sem argumentos. A
+        palavra consultada na tabela fica em até 12 bits para a tabela
+        continuar pequena; as chamadas seguintes usam esse teto até o
+        próximo bind.
+
+        Args:
+            max_level (int): Maior level que pode ser sorteado
+
+        Returns:
+            Callable[[], int]: Sorteia um level entre 0 e max_level.
+        """
+        self.max_level = max(max_level, 0)
+        if not self._bits:
+            self._draw = self._log_level
+            return self._draw
+
+        self._word_levels = min(self.max_level, max(1, 12 // self._bits))
+        self._word_width = self._bits * self._word_levels
+        self._table = _level_table(self._bits, self._word_levels)
+        self._draw = self._table_level
+        return self._draw
+
+    def __call__(self, max_level: int) -> int:
+        """Sorteia um level entre 0 e max_level."""
+        if max_level != self.max_level:
+            self.bind(max_level)
+        return self._draw()
+
+    def _table_level(self) -> int:
+        """Um único getrandbits consultado na tabela, sem laço por level."""
+        level = self._table[self._getrandbits(self._word_width)]
+        if level < self._word_levels:
+            return level
+        return self._deep_level()
+
+    def _deep_level(self) -> int:
+        """
+        Continua o sorteio quando a palavra veio toda zerada, isto é, o level
+        passou do que cabe em uma palavra (ou atingiu o teto).
+        """
+        level = self._word_levels
+        while level < self.max_level:
+            levels = min(self.max_level - level, self._word_levels)
+            word = self._getrandbits(self._bits * levels)
+            if word:
+                return level + ((word & -word).bit_length() - 1) // self._bits
+            level += levels
+        return self.max_level
+
+    def _log_level(self) -> int:
+        """Inverte a distribuição com um log, para p fora de 1/2^k."""
+        level = int(log(1.0 - self.rng.random()) / self._log_p)
+        return level if level < self.max_level else self.max_level
+
+
 class SkipList:
     """
     Skiplist com balanceamento probabilístico que deve tender a oferecer
@@ -32,34 +138,349 @@ class SkipList:
         - Pesquisa O(log n)
         - Inserção O(log n)
         - Deleção O(log n)
+        - Rank, select e count_range O(log n), com indexable=True
     """
 
-    def __init__(self, max_level: int = 4, p: float = 0.5):
+    def __init__(self, max_level: int = 4, p: float = 0.5,
+                 adaptive: bool = False, shrink: bool = False,
+                 finger: bool = False, seed: Optional[int] = None,
+                 level_generator: Optional[Callable[[int], int]] = None,
+                 multimap: bool = False, cache_size: int = 0,
+                 profile: bool = False, indexable: bool = False):
         """
         Vai inicializar a skiplist.
 
         Args:
-            max_level (int): O número máximo de levels da estrutura (default 4)
+            max_level (int): O número máximo de levels da estrutura (default 4).
+                No modo adaptativo funciona como o piso do teto de levels.
             p (int): O fator aleatório que promove um nível (default 0.5)
+            adaptive (bool): Se True, o teto de levels cresce conforme o
+                número de elementos passa pelas potências de 1/p (default False)
+            shrink (bool): No modo adaptativo, permite que o teto volte a
+                diminuir quando a estrutura esvazia (default False)
+            finger (bool): Se True, guarda o vetor de update da última operação
+                e a próxima começa dele, subindo só o necessário. Acessos
+                próximos custam O(log d), d sendo a distância até a chave
+                anterior (default False)
+            seed (Optional[int]): Seed do gerador de levels padrão, para
+                reproduzir execuções (default None)
+            level_generator (Optional[Callable[[int], int]]): Função que recebe
+                o teto atual e devolve o level de um novo Node. Se None, usa
+                GeometricLevels com a seed indicada (default None)
+            multimap (bool): Se True, chaves repetidas não sobrescrevem: cada
+                Node guarda a lista de valores da sua chave, sem torres
+                duplicadas. O tamanho, as larguras e as posições passam a
+                contar valores (default False)
+            cache_size (int): Capacidade de um cache LRU chave -> Node na
+                frente do search. Acertos voltam em O(1); o delete invalida
+                a entrada e, como o cache guarda o próprio Node, o insert de
+                uma chave existente já fica visível. 0 desliga (default 0)
+            profile (bool): Se True, cada search conta quantos saltos de
+                ponteiro a descida faz, para o stats() (default False)
+            indexable (bool): Se True, cada ponteiro guarda quantas posições
+                pula (a largura), o que habilita rank, select, o acesso por
+                índice e o count_range em O(log n). As larguras custam uma
+                atualização por level em todo insert e delete, então ficam
+                desligadas por padrão; sem elas esses métodos levantam
+                ValueError (default False)
         """
         
         self.max_level = max_level
         self.p = p
         self.level = 0 # maior level registrado
+        self.adaptive = adaptive
+        self.shrink = shrink
+        self._min_level = max_level
+        self._size = 0
+        self.multimap = multimap
+        self.cache_size = cache_size
+        self._cache: Optional[OrderedDict] = OrderedDict() if cache_size > 0 else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.finger = finger
+        self._finger: Optional[List[Node]] = None
+        self._finger_rank: List[int] = []
+        self.seed = seed
+        self._custom_generator = level_generator
+        self._level_generator = (level_generator if level_generator is not None
+                                 else GeometricLevels(p, Random(seed)))
+        self._sync_level_draw()
         
         self.header = Node(-(sys.maxsize - 1), -(sys.maxsize - 1), self.max_level + 1) # Header negativo
+        self._grow_at = self._capacity(self.max_level)
+        # Último Node de cada level e a posição dele (header quando o level está vazio)
+        self._tail: List[Node] = [self.header] * (self.max_level + 1)
+        self._tail_rank: List[int] = [0] * (self.max_level + 1)
+        # Quantos Nodes existem em cada level; o split só marca para recontar
+        self._level_counts: List[int] = [0] * (self.max_level + 1)
+        self._counts_stale = False
+        self.profile = profile
+        self.indexable = indexable
+        self._searches = 0
+        self._search_hops = 0
 
-    def _random_level(self) -> int:
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[int, Any]],
+                    heights: str = "geometric", **kwargs: Any) -> 'SkipList':
         """
-        Gera um level aleatório no qual o Node será adicionado.
+        Constrói a skiplist a partir de pares (chave, valor) já ordenados,
+        montando todas as lanes numa única passada linear, sem buscas:
+        cada elemento é só pendurado no final das lanes da sua torre.
+
+        Args:
+            items (Iterable[Tuple[int, Any]]): Pares em ordem crescente de chave.
+                Chaves repetidas mantêm o último valor, como no insert, ou
+                são todas guardadas no modo multimap.
+            heights (str): "geometric" sorteia as alturas como o insert;
+                "even" usa alturas espaçadas de forma regular (o i-ésimo
+                elemento sobe um nível a cada vez que 1/p divide i)
+            **kwargs: Os mesmos argumentos do construtor
+
+        Returns:
+            SkipList: A nova skiplist preenchida.
+
+        Raises:
+            ValueError: Se as chaves não estiverem ordenadas ou se heights
+                for inválido.
+        """
+        if heights not in ("geometric", "even"):
+            raise ValueError(f"heights inválido: {heights!r}")
+
+        skiplist = cls(**kwargs)
+        base = max(2, round(1 / skiplist.p))
+        nodes = 0
+        pending_key = None
+        pending_value: Any = None
+        has_pending = False
+
+        # Cada chave só é pendurada quando aparece a próxima, para juntar repetidas
+        for key, value in items:
+            if has_pending and key <= pending_key:
+                if key < pending_key:
+                    raise ValueError(f"Chaves fora de ordem: {key} depois de {pending_key}")
+                if skiplist.multimap:
+                    pending_value.append(value)
+                else:
+                    pending_value = value
+                continue
+
+            if has_pending:
+                nodes += 1
+                skiplist._append(pending_key, pending_value,
+                                 skiplist._bulk_level(heights, nodes, base))
+
+            pending_key = key
+            pending_value = [value] if skiplist.multimap else value
+            has_pending = True
+
+        if has_pending:
+            nodes += 1
+            skiplist._append(pending_key, pending_value,
+                             skiplist._bulk_level(heights, nodes, base))
+
+        return skiplist
+
+    def _bulk_level(self, heights: str, position: int, base: int) -> int:
+        """
+        Level do position-ésimo Node numa carga em lote: sorteado, ou quantas
+        vezes base divide position quando as alturas são regulares.
         """
+        if heights != "even":
+            return self._random_level()
 
         level = 0
-        while random() < self. p and level < self.max_level:
+        while position % base == 0 and level < self.max_level:
+            position //= base
             level += 1
-
         return level
 
+    def _append(self, key: int, value: Any, level: int) -> Node:
+        """
+        Pendura um novo Node, maior que todas as chaves, no fim das lanes
+        da sua torre usando o vetor de últimos Nodes. Não faz busca.
+        No modo multimap value já é a lista de valores do Node.
+        """
+        if level > self.level:
+            finger = self._finger
+            if finger is not None:
+                # Levels novos ficam só com o header no finger
+                missing = level + 1 - len(finger)
+                if missing > 0:
+                    finger.extend([None] * missing)
+                    self._finger_rank.extend([0] * missing)
+                for i in range(self.level + 1, level + 1):
+                    finger[i] = self.header
+                    self._finger_rank[i] = 0
+            self.level = level
+
+        node = Node(key, value, level + 1, self.indexable)
+        pos = self._size + (len(value) if self.multimap else 1)
+        tail = self._tail
+        tail_rank = self._tail_rank
+        level_counts = self._level_counts
+        if tail[0] is not self.header:
+            node.backward = tail[0]
+
+        if self.indexable:
+            for i in range(level + 1):
+                tail[i].width[i] = pos - tail_rank[i]
+                tail_rank[i] = pos
+        for i in range(level + 1):
+            tail[i].forward[i] = node
+            tail[i] = node
+            level_counts[i] += 1
+
+        self._size = pos
+        if self.adaptive and pos > self._grow_at:
+            self._grow()
+
+        return node
+
+    def _capacity(self, level: int) -> int:
+        """
+        Quantidade de elementos que um teto de levels comporta mantendo a
+        busca em O(log n), ou seja, (1/p) ** level.
+        """
+        return int((1 / self.p) ** level)
+
+    def _grow(self) -> None:
+        """
+        Sobe o teto de levels enquanto o tamanho ultrapassar a capacidade,
+        estendendo o forward do header no lugar.
+        """
+        while self._size > self._grow_at:
+            self._raise_ceiling(self.max_level + 1)
+
+    def _raise_ceiling(self, max_level: int) -> None:
+        """Estende o header até o teto indicado."""
+        while self.max_level < max_level:
+            self.max_level += 1
+            self.header.forward.append(None)
+            self.header.width.append(0)
+            self._tail.append(self.header)
+            self._tail_rank.append(0)
+            self._level_counts.append(0)
+        self._grow_at = self._capacity(self.max_level)
+        self._sync_level_draw()
+
+    def _shrink(self) -> None:
+        """
+        Baixa o teto de levels quando o tamanho cai abaixo da capacidade de
+        dois levels a menos (a folga evita oscilar em torno do limite).
+        As torres que passam do novo teto são truncadas.
+        """
+        while (self.max_level > self._min_level and
+               self._size < self._capacity(self.max_level - 2)):
+            top = self.max_level
+            node = self.header.forward[top]
+            while node is not None:
+                next_node = node.forward[top]
+                del node.forward[top:]
+                if self.indexable:
+                    del node.width[top:]
+                node = next_node
+
+            self.header.forward.pop()
+            self.header.width.pop()
+            self._tail.pop()
+            self._tail_rank.pop()
+            self._level_counts.pop()
+            self.max_level -= 1
+            self._grow_at = self._capacity(self.max_level)
+            if self.level > self.max_level:
+                self.level = self.max_level
+        self._sync_level_draw()
+
+    def _sync_level_draw(self) -> None:
+        """
+        Com o gerador padrão, o _random_level da instância passa a ser o
+        sorteio dele preso ao teto atual, e é refeito quando o teto muda.
+        """
+        if self._custom_generator is None:
+            self._random_level = self._level_generator.bind(self.max_level)
+
+    def _random_level(self) -> int:
+        """Gera um level aleatório no qual o Node será adicionado."""
+        return self._level_generator(self.max_level)
+
+    def _descend(self, key: int) -> Tuple[List[Optional[Node]], Optional[List[int]]]:
+        """
+        Encontra, em cada level, o último Node com chave menor que key e a
+        posição dele. No modo finger a descida parte do vetor da operação
+        anterior: sobe enquanto o Node guardado não cerca key e desce dali.
+        Os levels de cima continuam valendo, então o vetor é atualizado no
+        lugar e vira o finger da próxima operação.
+
+        Returns:
+            Tuple[List[Optional[Node]], Optional[List[int]]]: O vetor de
+            update e as posições de cada Node dele (só calculadas com
+            indexable; sem indexable nem finger vem None).
+        """
+        current = self.header
+        pos = 0
+        top = self.level
+
+        if not self.finger:
+            update: List[Optional[Node]] = [None] * (self.max_level + 1)
+            rank = [0] * (self.max_level + 1) if self.indexable else None
+        elif self._finger is None:
+            update = self._finger = [None] * (self.max_level + 1)
+            rank = self._finger_rank = [0] * (self.max_level + 1)
+        else:
+            update, rank = self._finger, self._finger_rank
+            if len(update) <= self.max_level:
+                missing = self.max_level + 1 - len(update)
+                update.extend([None] * missing)
+                rank.extend([0] * missing)
+
+            i = 0
+            while i < top:
+                node = update[i]
+                next_node = node.forward[i]
+                if ((node is self.header or node.key < key) and
+                        (next_node is None or next_node.key >= key)):
+                    break
+                i += 1
+
+            node = update[i]
+            if node is self.header or node.key < key:
+                current = node
+                pos = rank[i]
+                top = i
+
+        if not self.indexable:
+            for i in range(top, -1, -1):
+                while (current.forward[i] is not None and
+                       current.forward[i].key < key):
+                    current = current.forward[i]
+                update[i] = current
+            return update, rank
+
+        for i in range(top, -1, -1):
+            while (current.forward[i] is not None and
+                   current.forward[i].key < key):
+                pos += current.width[i]
+                current = current.forward[i]
+            update[i] = current
+            rank[i] = pos
+
+        return update, rank
+
+    def _plain_descend(self, key: int) -> List[Optional[Node]]:
+        """
+        Vetor de update sem finger nem larguras, usado pelo insert e pelo
+        delete: a descida do search guardando o Node de cada level.
+        """
+        update: List[Optional[Node]] = [None] * (self.max_level + 1)
+        current = self.header
+        for i in range(self.level, -1, -1):
+            next_node = current.forward[i]
+            while next_node is not None and next_node.key < key:
+                current = next_node
+                next_node = current.forward[i]
+            update[i] = current
+        return update
+
     def search(self, key: int) -> Optional[Any]:
         """
         Procura por uma nova chave na skiplist
@@ -70,21 +491,119 @@ class SkipList:
         Returns:
             O valor associado a chave indicada.
         """
-        
+
+        if self.profile:
+            return self._profiled_search(key)
+
+        cache = self._cache
+        if cache is not None:
+            current = cache.get(key)
+            if current is not None:
+                cache.move_to_end(key)
+                self.cache_hits += 1
+                return current.value[0] if self.multimap else current.value
+            self.cache_misses += 1
+
+        if self.finger:
+            update, _ = self._descend(key)
+            current = update[0].forward[0]
+        else:
+            current = self.header
+
+            for i in range(self.level, -1, -1):
+                while (current.forward[i] is not None and
+                       current.forward[i].key < key):
+                    current = current.forward[i]
+
+            current = current.forward[0]
+
+        if current is not None and current.key == key:
+            if cache is not None:
+                cache[key] = current
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+            # No multimap devolve o valor mais antigo
+            return current.value[0] if self.multimap else current.value
+
+        return None
+
+    def _profiled_search(self, key: int) -> Optional[Any]:
+        """
+        Busca a partir do header contando os saltos de ponteiro. Ignora o
+        cache e o finger de propósito: mede o custo da estrutura em si.
+        """
         current = self.header
+        hops = 0
 
         for i in range(self.level, -1, -1):
             while (current.forward[i] is not None and
                    current.forward[i].key < key):
                 current = current.forward[i]
+                hops += 1
 
+        self._searches += 1
+        self._search_hops += hops
         current = current.forward[0]
 
         if current is not None and current.key == key:
-            return current.value
-
+            return current.value[0] if self.multimap else current.value
         return None
 
+    def stats(self) -> dict:
+        """
+        Estatísticas da distribuição de levels, em O(levels) a partir das
+        contagens mantidas pelo insert e pelo delete. split, join com uma
+        skiplist recém-dividida e expire_before não visitam os Nodes que
+        movem ou removem, então depois deles a primeira chamada reconta os
+        levels percorrendo o level 0, O(n), e as seguintes voltam a ser
+        O(levels). Quem chama stats() depois de cada expiração paga esse
+        O(n) toda vez.
+
+        Returns:
+            dict: size (elementos), nodes, level, max_level, nodes_per_level
+            (do level 0 para cima), avg_height (altura média das torres),
+            expected_height (1/(1-p), para comparação), searches e avg_hops
+            (saltos por busca, None se nenhuma busca foi perfilada).
+        """
+        if self._counts_stale:
+            counts = [0] * (self.max_level + 1)
+            current = self.header.forward[0]
+            while current is not None:
+                for i in range(len(current.forward)):
+                    counts[i] += 1
+                current = current.forward[0]
+            self._level_counts = counts
+            self._counts_stale = False
+
+        nodes = self._level_counts[0]
+        return {
+            "size": self._size,
+            "nodes": nodes,
+            "level": self.level,
+            "max_level": self.max_level,
+            "nodes_per_level": list(self._level_counts[:self.level + 1]),
+            "avg_height": sum(self._level_counts) / nodes if nodes else 0.0,
+            "expected_height": 1 / (1 - self.p),
+            "searches": self._searches,
+            "avg_hops": self._search_hops / self._searches if self._searches else None,
+        }
+
+    def reset_profile(self) -> None:
+        """Zera os contadores de saltos do profiling."""
+        self._searches = 0
+        self._search_hops = 0
+
+    def cache_info(self) -> dict:
+        """Retorna acertos, falhas, taxa de acerto e ocupação do cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "size": len(self._cache) if self._cache is not None else 0,
+            "capacity": self.cache_size,
+        }
+
     def insert(self, key: int, value: Any) -> None:
         """
         Operação de inserção na estrutura, com o par chave valor, o nível
@@ -92,43 +611,92 @@ class SkipList:
         Após o processo de criar o objeto para inserção ele vai procurar atribuir 
         no nível adequado e refazer o processo para todos os elementos seguintes.
 
+        No modo multimap uma chave repetida ganha mais um valor no mesmo Node.
+
         Args:
             key (int): Chave que identifica o nó que você quer encontrar
             value (Any): Valor atribuído ao nó que você quer encontrar
         """
+
+        # Chave maior que todas: liga direto no fim, sem descer
+        last = self._tail[0]
+        if last is self.header or key > last.key:
+            self._append(key, [value] if self.multimap else value,
+                         self._random_level())
+            return
         
-        update = [None] * (self.max_level + 1)
-        current = self.header
-        
-        for i in range(self.level, -1, -1):
-            
-            while (current.forward[i] is not None and 
-                   current.forward[i].key < key):
-                current = current.forward[i]
-            update[i] = current
-        
-        current = current.forward[0]
+        if self.finger or self.indexable:
+            update, rank = self._descend(key) # rank guarda a posição de cada update
+        else:
+            # Sem finger nem larguras a descida é a mesma do search
+            update, rank = self._plain_descend(key), None
+        current = update[0].forward[0]
         
         if current is not None and current.key == key:
-            current.value = value
+            if self.multimap:
+                current.value.append(value)
+                self._resize_node(update, 1)
+            else:
+                current.value = value
             return
+
+        if self.multimap:
+            value = [value]
         
         new_level = self._random_level()
         
         if new_level > self.level:
             for i in range(self.level + 1, new_level + 1):
                 update[i] = self.header
+                if rank is not None:
+                    rank[i] = 0
             self.level = new_level
         
-        new_node = Node(key, value, new_level + 1)
+        new_node = Node(key, value, new_level + 1, self.indexable)
+        level_counts = self._level_counts
 
-        for i in range(new_level):
-            new_node.forward[i] = update[i].forward[i]
-            update[i].forward[i] = new_node
+        if not self.indexable:
+            for i in range(new_level + 1):
+                level_counts[i] += 1
+                next_node = update[i].forward[i]
+                new_node.forward[i] = next_node
+                if next_node is None:
+                    self._tail[i] = new_node
+                update[i].forward[i] = new_node
+        else:
+            new_pos = rank[0] + 1
+            for i in range(new_level + 1):
+                level_counts[i] += 1
+                next_node = update[i].forward[i]
+                new_node.forward[i] = next_node
+                if next_node is not None:
+                    new_node.width[i] = rank[i] + update[i].width[i] + 1 - new_pos
+                    self._tail_rank[i] += 1
+                else:
+                    self._tail[i] = new_node
+                    self._tail_rank[i] = new_pos
+                update[i].forward[i] = new_node
+                update[i].width[i] = new_pos - rank[i]
+
+            # Os ponteiros que passam por cima do novo node pulam um a mais
+            for i in range(new_level + 1, self.level + 1):
+                if update[i].forward[i] is not None:
+                    update[i].width[i] += 1
+                    self._tail_rank[i] += 1
+
+        if update[0] is not self.header:
+            new_node.backward = update[0]
+        if new_node.forward[0] is not None:
+            new_node.forward[0].backward = new_node
+
+        self._size += 1
+        if self.adaptive and self._size > self._grow_at:
+            self._grow()
 
     def delete(self, key: int) -> bool:
         """
-        Deleta um elemento da skiplist.
+        Deleta um elemento da skiplist (no modo multimap, todos os valores
+        da chave).
 
         Args:
             key (int): Chave que identifica o elemento a ser deletado.
@@ -137,36 +705,296 @@ class SkipList:
             Retorna se conseguiu achar/deletar o nó com a chave indicada.
         """
 
-        # Para anotar os Nodes que precisam atualizar
-        update = [None] * (self.max_level + 1)
-        current = self.header
-        
-        # Encontra o node para deletar
-        for i in range(self.level, -1, -1):
-            while (current.forward[i] is not None and 
-                   current.forward[i].key < key):
-                current = current.forward[i]
-            update[i] = current
+        # Encontra os Nodes que precisam atualizar
+        if self.finger or self.indexable:
+            update, rank = self._descend(key)
+        else:
+            update, rank = self._plain_descend(key), None
         
         # Move pro próximo no level 0
-        current = current.forward[0]
+        current = update[0].forward[0]
         
         # Se não achar
         if current is None or current.key != key:
             return False
+
+        self._unlink(current, update, rank)
+        return True
+
+    def _unlink(self, current: Node, update: List[Optional[Node]],
+                rank: Optional[List[int]]) -> None:
+        """Tira um Node de todos os levels a partir do seu vetor de update."""
+        weight = len(current.value) if self.multimap else 1
+        if self._cache is not None:
+            self._cache.pop(current.key, None)
         
+        forward = current.forward
+        if forward[0] is not None:
+            forward[0].backward = current.backward
+
         # Atualiza os ponteiros seguintes
+        level_counts = self._level_counts
+        if not self.indexable:
+            tail = self._tail
+            for i in range(len(forward)):
+                level_counts[i] -= 1
+                next_node = forward[i]
+                update[i].forward[i] = next_node
+                if next_node is None:
+                    tail[i] = update[i]
+        else:
+            for i in range(len(forward)):
+                level_counts[i] -= 1
+            self._unlink_widths(current, update, rank, weight)
+
+        # Remove os vazios (só um Node que chega no topo pode esvaziá-lo)
+        if len(forward) > self.level:
+            while self.level > 0 and self.header.forward[self.level] is None:
+                self.level -= 1
+
+        self._size -= weight
+        if self.adaptive and self.shrink:
+            self._shrink()
+
+    def _unlink_widths(self, current: Node, update: List[Optional[Node]],
+                       rank: List[int], weight: int) -> None:
+        """Religa os ponteiros em volta de current acertando as larguras."""
         for i in range(self.level + 1):
-            if update[i].forward[i] != current:
-                break
-            update[i].forward[i] = current.forward[i]
+            if update[i].forward[i] is current:
+                update[i].forward[i] = current.forward[i]
+                if current.forward[i] is not None:
+                    update[i].width[i] += current.width[i] - weight
+                    self._tail_rank[i] -= weight
+                else:
+                    update[i].width[i] = 0
+                    self._tail[i] = update[i]
+                    self._tail_rank[i] = rank[i]
+            elif update[i].forward[i] is not None:
+                update[i].width[i] -= weight
+                self._tail_rank[i] -= weight
 
-        # Remove os vazios        
-        while self.level > 0 and self.header.forward[self.level] is None:
-            self.level -= 1
-        
+    def _resize_node(self, update: List[Optional[Node]], delta: int) -> None:
+        """
+        Ajusta as larguras quando o Node logo depois de update[0] ganha ou
+        perde valores no modo multimap: todo ponteiro que chega nele ou
+        passa por cima dele muda delta posições, assim como os últimos
+        Nodes que estão depois dele.
+        """
+        if self.indexable:
+            for i in range(self.level + 1):
+                if update[i].forward[i] is not None:
+                    update[i].width[i] += delta
+                    self._tail_rank[i] += delta
+        self._size += delta
+
+    def count(self, key: int) -> int:
+        """
+        Quantos valores a chave tem: no modo multimap o tamanho da lista do
+        Node, senão 1 ou 0. O(log n).
+        """
+        node = self._first_from(key)
+        if node is None or node.key != key:
+            return 0
+        return len(node.value) if self.multimap else 1
+
+    def get_all(self, key: int) -> List[Any]:
+        """
+        Retorna todos os valores da chave, na ordem de inserção.
+
+        Args:
+            key (int): Chave pesquisada
+
+        Returns:
+            List[Any]: Os valores (lista vazia se a chave não existe).
+        """
+        node = self._first_from(key)
+        if node is None or node.key != key:
+            return []
+        return list(node.value) if self.multimap else [node.value]
+
+    def delete_one(self, key: int) -> bool:
+        """
+        Remove só um valor da chave (o mais antigo). A torre só sai da
+        estrutura quando a chave perde o último valor. Fora do modo
+        multimap é igual ao delete.
+
+        Args:
+            key (int): Chave que identifica o elemento a ser deletado.
+
+        Returns:
+            Retorna se conseguiu achar/deletar um valor da chave.
+        """
+        if not self.multimap:
+            return self.delete(key)
+
+        update, rank = self._descend(key)
+        current = update[0].forward[0]
+
+        if current is None or current.key != key:
+            return False
+
+        if len(current.value) == 1:
+            self._unlink(current, update, rank)
+        else:
+            current.value.pop(0)
+            self._resize_node(update, -1)
         return True
 
+    def peek_last(self) -> Optional[Tuple[int, Any]]:
+        """
+        Retorna o par (chave, valor) com a maior chave em O(1), lendo o
+        último Node do level 0.
+        """
+        last = self._tail[0]
+        if last is self.header:
+            return None
+        return last.key, last.value[-1] if self.multimap else last.value
+
+    def max(self) -> Optional[int]:
+        """Retorna a maior chave em O(1), ou None se estiver vazia."""
+        last = self._tail[0]
+        return None if last is self.header else last.key
+
+    def _last_before(self, key: int, inclusive: bool = False) -> Optional[Node]:
+        """
+        Último Node com chave menor (ou menor ou igual) que key: uma descida
+        até o seguinte e um passo para trás.
+        """
+        following = self._first_from(key, not inclusive)
+        if following is not None:
+            return following.backward
+        last = self._tail[0]
+        return None if last is self.header else last
+
+    def predecessor(self, key: int) -> Optional[Tuple[int, Any]]:
+        """
+        Retorna o par (chave, valor) com a maior chave estritamente menor
+        que key, em O(log n). key não precisa estar na skiplist.
+
+        Args:
+            key (int): Chave de referência
+
+        Returns:
+            Optional[Tuple[int, Any]]: O par, ou None se não houver chave menor.
+        """
+        node = self._last_before(key)
+        if node is None:
+            return None
+        return node.key, node.value[0] if self.multimap else node.value
+
+    def successor(self, key: int) -> Optional[Tuple[int, Any]]:
+        """
+        Retorna o par (chave, valor) com a menor chave estritamente maior
+        que key, em O(log n). key não precisa estar na skiplist.
+
+        Args:
+            key (int): Chave de referência
+
+        Returns:
+            Optional[Tuple[int, Any]]: O par, ou None se não houver chave maior.
+        """
+        node = self._first_from(key, inclusive=False)
+        if node is None:
+            return None
+        return node.key, node.value[0] if self.multimap else node.value
+
+    def _require_index(self, operation: str) -> None:
+        """Garante que as larguras existem antes de uma operação posicional."""
+        if not self.indexable:
+            raise ValueError(f"{operation} precisa de uma skiplist criada com indexable=True")
+
+    def _rank(self, key: int, inclusive: bool = False) -> int:
+        """
+        Conta as chaves menores (ou menores ou iguais) que key somando as
+        larguras dos ponteiros percorridos na descida.
+        """
+        self._require_index("rank")
+        current = self.header
+        pos = 0
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] is not None and (
+                    current.forward[i].key <= key if inclusive
+                    else current.forward[i].key < key):
+                pos += current.width[i]
+                current = current.forward[i]
+
+        return pos
+
+    def rank(self, key: int) -> int:
+        """
+        Retorna quantas chaves menores que key existem na skiplist, ou seja,
+        a posição (a partir de 0) que key ocupa ou ocuparia. O(log n) esperado.
+
+        Args:
+            key (int): Chave de referência
+
+        Returns:
+            int: Número de chaves estritamente menores que key.
+
+        Raises:
+            ValueError: Se a skiplist não for indexable.
+        """
+        return self._rank(key)
+
+    def select(self, index: int) -> Tuple[int, Any]:
+        """
+        Retorna o par (chave, valor) na posição index da ordem crescente,
+        descendo pelos levels guiado pelas larguras. O(log n) esperado.
+
+        Args:
+            index (int): Posição desejada, começando em 0
+
+        Returns:
+            Tuple[int, Any]: O par chave valor nessa posição.
+
+        Raises:
+            IndexError: Se a posição estiver fora da skiplist.
+            ValueError: Se a skiplist não for indexable.
+        """
+        self._require_index("select")
+        if index < 0 or index >= self._size:
+            raise IndexError("Posição fora da skiplist")
+
+        # Para no último Node antes da posição; o seguinte contém index
+        current = self.header
+        pos = 0
+
+        for i in range(self.level, -1, -1):
+            while (current.forward[i] is not None and
+                   pos + current.width[i] <= index):
+                pos += current.width[i]
+                current = current.forward[i]
+
+        current = current.forward[0]
+        if self.multimap:
+            return current.key, current.value[index - pos]
+        return current.key, current.value
+
+    def __getitem__(self, index: int) -> Tuple[int, Any]:
+        """Acesso posicional, aceitando índices negativos como uma lista."""
+        if index < 0:
+            index += self._size
+        return self.select(index)
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """
+        Conta as chaves no intervalo fechado [lo, hi] com duas descidas.
+
+        Args:
+            lo (int): Limite inferior
+            hi (int): Limite superior
+
+        Returns:
+            int: Quantidade de chaves entre lo e hi.
+
+        Raises:
+            ValueError: Se a skiplist não for indexable.
+        """
+        self._require_index("count_range")
+        if lo > hi:
+            return 0
+        return self._rank(hi, inclusive=True) - self._rank(lo)
 
     def display(self) -> None:
         """Display the skiplist structure (for debugging)."""
@@ -184,31 +1012,471 @@ class SkipList:
         return self.search(key) is not None
     
     def __len__(self) -> int:
-        """Return the number of elements in the skiplist."""
-        count = 0
-        current = self.header.forward[0]
-        while current is not None:
-            count += 1
-            current = current.forward[0]
-        return count
+        """Return the number of elements in the skiplist, in O(1)."""
+        return self._size
     
     def keys(self) -> List[int]:
-        """Return all keys in sorted order."""
-        keys = []
-        current = self.header.forward[0]
-        while current is not None:
-            keys.append(current.key)
-            current = current.forward[0]
-        return keys
+        """Return all keys in sorted order (repeated per value in multimap mode)."""
+        return list(self)
     
     def items(self) -> List[tuple]:
         """Return all key-value pairs in sorted order."""
-        items = []
-        current = self.header.forward[0]
+        return list(self.range())
+
+    def _empty_like(self) -> 'SkipList':
+        """
+        Cria uma skiplist vazia com as mesmas configurações e o mesmo teto
+        de levels (que pode ter crescido no modo adaptativo).
+        """
+        new_skiplist = type(self)(max_level=self._min_level, p=self.p,
+                                  adaptive=self.adaptive, shrink=self.shrink,
+                                  finger=self.finger, seed=self.seed,
+                                  level_generator=self._custom_generator,
+                                  multimap=self.multimap, cache_size=self.cache_size,
+                                  profile=self.profile, indexable=self.indexable)
+        new_skiplist._raise_ceiling(self.max_level)
+        return new_skiplist
+
+    def _clear(self) -> None:
+        """Esvazia a skiplist, trocando o header por um novo."""
+        self.header = Node(self.header.key, self.header.value, self.max_level + 1)
+        self.level = 0
+        self._size = 0
+        self._finger = None
+        self._tail = [self.header] * (self.max_level + 1)
+        self._tail_rank = [0] * (self.max_level + 1)
+        self._level_counts = [0] * (self.max_level + 1)
+        self._counts_stale = False
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _trim_level(self) -> None:
+        """Baixa o level registrado enquanto o topo estiver vazio."""
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+
+    def split(self, key: int) -> Tuple['SkipList', 'SkipList']:
+        """
+        Divide a skiplist em duas cortando, em cada level, o ponteiro que
+        atravessa key, com uma única descida. Com indexable o tamanho das
+        partes sai das larguras e o custo é O(log n) esperado; sem indexable
+        (o padrão) ele é contado pelo level 0 a partir da ponta mais perto
+        do corte, O(min(k, n - k)) para k chaves à esquerda. Os Nodes passam
+        para as novas skiplists e a original fica vazia.
+
+        Args:
+            key (int): Chave de corte
+
+        Returns:
+            Tuple[SkipList, SkipList]: A skiplist com as chaves menores que
+            key e a com as chaves maiores ou iguais a key.
+        """
+        update, rank = self._descend(key)
+        left_size = rank[0] if self.indexable else self._size_through(update[0])
+
+        left = self._empty_like()
+        right = self._empty_like()
+
+        for i in range(self.level + 1):
+            node = update[i]
+            if node.forward[i] is not None:
+                right.header.forward[i] = node.forward[i]
+                right._tail[i] = self._tail[i]
+                if self.indexable:
+                    right.header.width[i] = rank[i] + node.width[i] - left_size
+                    right._tail_rank[i] = self._tail_rank[i] - left_size
+                    node.width[i] = 0
+                node.forward[i] = None
+
+        if right.header.forward[0] is not None:
+            right.header.forward[0].backward = None
+
+        left.header = self.header
+        left._tail = [update[i] if i <= self.level else self.header
+                      for i in range(self.max_level + 1)]
+        if self.indexable:
+            left._tail_rank = [rank[i] if i <= self.level else 0
+                               for i in range(self.max_level + 1)]
+        left.level = right.level = self.level
+        left._size = left_size
+        right._size = self._size - left_size
+
+        for part in (left, right):
+            part._counts_stale = True
+            part._trim_level()
+            if part.adaptive and part.shrink:
+                part._shrink()
+
+        self._clear()
+        return left, right
+
+    def _size_through(self, last: Node) -> int:
+        """
+        Quantidade de valores do começo até last, inclusive, sem usar as
+        larguras. Conta ao mesmo tempo para frente a partir do primeiro Node
+        e para trás a partir do último, e para no lado que acabar antes.
+        """
+        if last is self.header:
+            return 0
+        if last is self._tail[0]:
+            return self._size
+
+        multimap = self.multimap
+        ahead = self.header.forward[0]
+        behind = self._tail[0]
+        counted_ahead = counted_behind = 0
+        while True:
+            counted_ahead += len(ahead.value) if multimap else 1
+            if ahead is last:
+                return counted_ahead
+            ahead = ahead.forward[0]
+            counted_behind += len(behind.value) if multimap else 1
+            behind = behind.backward
+            if behind is last:
+                return self._size - counted_behind
+
+    def join(self, other: 'SkipList') -> 'SkipList':
+        """
+        Concatena other no fim desta skiplist, ligando o último Node de cada
+        level ao primeiro Node de other no mesmo level. Todas as chaves de
+        other precisam ser maiores que as daqui. Como os últimos Nodes já
+        são conhecidos, custa O(levels), e other fica vazia.
+
+        Args:
+            other (SkipList): Skiplist com as chaves maiores
+
+        Returns:
+            SkipList: Esta mesma skiplist, já com os elementos de other.
+
+        Raises:
+            ValueError: Se os intervalos de chaves se sobrepõem ou se só uma
+                das duas está no modo multimap ou é indexable.
+        """
+        if other.multimap != self.multimap:
+            raise ValueError("Não dá para juntar uma skiplist multimap com uma comum")
+        if other.indexable != self.indexable:
+            raise ValueError("Não dá para juntar uma skiplist indexable com uma sem larguras")
+
+        first = other.header.forward[0]
+        if first is None:
+            return self
+
+        last = self._tail[0]
+        if last is not self.header and last.key >= first.key:
+            raise ValueError("As chaves de other precisam ser maiores que as desta skiplist")
+
+        if self.max_level < other.max_level:
+            self._raise_ceiling(other.max_level)
+        if last is not self.header:
+            first.backward = last
+
+        for i in range(other.level + 1):
+            if other.header.forward[i] is not None:
+                node = self._tail[i]
+                node.forward[i] = other.header.forward[i]
+                if self.indexable:
+                    node.width[i] = self._size - self._tail_rank[i] + other.header.width[i]
+                    self._tail_rank[i] = self._size + other._tail_rank[i]
+                self._tail[i] = other._tail[i]
+
+        if other._counts_stale:
+            self._counts_stale = True
+        for i in range(other.level + 1):
+            self._level_counts[i] += other._level_counts[i]
+
+        self.level = max(self.level, other.level)
+        self._size += other._size
+        self._finger = None
+        other._clear()
+
+        if self.adaptive and self._size > self._grow_at:
+            self._grow()
+
+        return self
+
+    def _merge(self, other: 'SkipList', keep_left: bool, keep_both: Optional[str],
+               keep_right: bool) -> 'SkipList':
+        """
+        Percorre os dois levels 0 juntos, como no merge do mergesort, e vai
+        pendurando no fim do resultado as chaves escolhidas: O(n + m),
+        sem nenhuma busca.
+
+        Args:
+            other (SkipList): A outra skiplist
+            keep_left (bool): Se mantém as chaves só desta skiplist
+            keep_both (Optional[str]): De onde vem o valor das chaves comuns:
+                "left", "right", "concat" (junta as listas do multimap) ou
+                None para descartá-las
+            keep_right (bool): Se mantém as chaves só de other
+        """
+        if other.multimap != self.multimap:
+            raise ValueError("As duas skiplists precisam estar no mesmo modo (multimap ou não)")
+
+        result = self._empty_like()
+        multimap = self.multimap
+        left = self.header.forward[0]
+        right = other.header.forward[0]
+
+        def own(value: Any) -> Any:
+            return list(value) if multimap else value
+
+        while left is not None or right is not None:
+            if right is None or (left is not None and left.key < right.key):
+                if keep_left:
+                    result._append(left.key, own(left.value), result._random_level())
+                left = left.forward[0]
+            elif left is None or right.key < left.key:
+                if keep_right:
+                    result._append(right.key, own(right.value), result._random_level())
+                right = right.forward[0]
+            else:
+                if keep_both is not None:
+                    if keep_both == "concat":
+                        value = left.value + right.value
+                    else:
+                        value = own(left.value if keep_both == "left" else right.value)
+                    result._append(left.key, value, result._random_level())
+                left = left.forward[0]
+                right = right.forward[0]
+
+        return result
+
+    def union(self, other: 'SkipList') -> 'SkipList':
+        """
+        Nova skiplist com as chaves das duas. Nas chaves comuns vale o valor
+        de other, como no dict.update (no multimap os valores são somados).
+        O(n + m).
+        """
+        return self._merge(other, True, "concat" if self.multimap else "right", True)
+
+    def intersection(self, other: 'SkipList') -> 'SkipList':
+        """Nova skiplist com as chaves presentes nas duas, com os valores daqui. O(n + m)."""
+        return self._merge(other, False, "left", False)
+
+    def difference(self, other: 'SkipList') -> 'SkipList':
+        """Nova skiplist com as chaves daqui que não estão em other. O(n + m)."""
+        return self._merge(other, True, None, False)
+
+    def __or__(self, other: 'SkipList') -> 'SkipList':
+        return self.union(other)
+
+    def __and__(self, other: 'SkipList') -> 'SkipList':
+        return self.intersection(other)
+
+    def __sub__(self, other: 'SkipList') -> 'SkipList':
+        return self.difference(other)
+
+    def delete_range(self, lo: Optional[int] = None, hi: Optional[int] = None,
+                     inclusive: Tuple[bool, bool] = (True, True),
+                     return_items: bool = False) -> Any:
+        """
+        Remove de uma vez todas as chaves entre lo e hi. Os vetores de update
+        das duas bordas são encontrados uma única vez (o da borda de cima
+        partindo do de baixo) e o trecho é desligado de cada level, sem
+        buscas por chave: O(log n + k).
+
+        Args:
+            lo (Optional[int]): Limite inferior, None para começar do início
+            hi (Optional[int]): Limite superior, None para ir até o fim
+            inclusive (Tuple[bool, bool]): Se cada limite entra no intervalo
+            return_items (bool): Se True, retorna um gerador com os pares
+                (chave, valor) removidos em vez da contagem
+
+        Returns:
+            int: Quantidade de elementos removidos, ou o gerador dos pares
+            removidos se return_items for True.
+        """
+        lo_inclusive, hi_inclusive = inclusive
+        top = self.level
+        self._finger = None
+
+        # Borda de baixo: último Node antes do intervalo em cada level
+        start = [self.header] * (top + 1)
+        start_rank = [0] * (top + 1)
+        current = self.header
+        pos = 0
+        indexable = self.indexable
+        for i in range(top, -1, -1):
+            while current.forward[i] is not None and lo is not None and (
+                    current.forward[i].key < lo if lo_inclusive
+                    else current.forward[i].key <= lo):
+                if indexable:
+                    pos += current.width[i]
+                current = current.forward[i]
+            start[i] = current
+            start_rank[i] = pos
+
+        # Borda de cima: último Node dentro do intervalo em cada level
+        end = [self.header] * (top + 1)
+        end_rank = [0] * (top + 1)
+        current = self.header
+        pos = 0
+        for i in range(top, -1, -1):
+            node = start[i]
+            if node is not self.header and (current is self.header or node.key > current.key):
+                current = node
+                pos = start_rank[i]
+            while current.forward[i] is not None and (
+                    hi is None or
+                    (current.forward[i].key <= hi if hi_inclusive
+                     else current.forward[i].key < hi)):
+                if indexable:
+                    pos += current.width[i]
+                current = current.forward[i]
+            end[i] = current
+            end_rank[i] = pos
+
+        first = start[0].forward[0]
+        stop = end[0].forward[0]
+        if start[0] is end[0]:
+            return iter(()) if return_items else 0
+
+        if self._cache is not None:
+            self._cache.clear()
+
+        # O trecho continua encadeado no level 0 mesmo depois de desligado
+        removed = 0
+        node = first
+        while node is not stop:
+            for i in range(len(node.forward)):
+                self._level_counts[i] -= 1
+            removed += len(node.value) if self.multimap else 1
+            node = node.forward[0]
+
+        for i in range(top + 1):
+            node = start[i]
+            if not indexable:
+                if end[i] is not node:
+                    node.forward[i] = end[i].forward[i]
+                    if node.forward[i] is None:
+                        self._tail[i] = node
+                continue
+            if end[i] is node:
+                # Nenhum Node do intervalo nesse level, o ponteiro só encolhe
+                if node.forward[i] is not None:
+                    node.width[i] -= removed
+                    self._tail_rank[i] -= removed
+                continue
+            following = end[i].forward[i]
+            node.forward[i] = following
+            if following is not None:
+                node.width[i] = end_rank[i] + end[i].width[i] - start_rank[i] - removed
+                self._tail_rank[i] -= removed
+            else:
+                node.width[i] = 0
+                self._tail[i] = node
+                self._tail_rank[i] = start_rank[i]
+
+        if stop is not None:
+            stop.backward = start[0] if start[0] is not self.header else None
+
+        self._trim_level()
+        self._size -= removed
+        if self.adaptive and self.shrink:
+            self._shrink()
+
+        if return_items:
+            return self._walk(first, stop)
+        return removed
+
+    def _walk(self, node: Optional[Node], stop: Optional[Node]) -> Iterator[Tuple[int, Any]]:
+        """Percorre os pares pelo level 0 de node até antes de stop."""
+        while node is not stop:
+            if self.multimap:
+                for value in node.value:
+                    yield node.key, value
+            else:
+                yield node.key, node.value
+            node = node.forward[0]
+
+    def _first_from(self, key: int, inclusive: bool = True) -> Optional[Node]:
+        """
+        Desce os levels uma única vez e retorna o primeiro Node com chave
+        maior ou igual (ou estritamente maior) que key.
+        """
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] is not None and (
+                    current.forward[i].key < key if inclusive
+                    else current.forward[i].key <= key):
+                current = current.forward[i]
+
+        return current.forward[0]
+
+    def range(self, lo: Optional[int] = None, hi: Optional[int] = None,
+              inclusive: Tuple[bool, bool] = (True, True),
+              reverse: bool = False) -> Iterator[Tuple[int, Any]]:
+        """
+        Percorre preguiçosamente os pares (chave, valor) entre lo e hi
+        (no modo multimap, um par por valor).
+        Só uma descida é feita para achar lo, depois o level 0 é seguido
+        enquanto as chaves estiverem no intervalo: O(log n + k), sem montar
+        listas intermediárias.
+
+        Args:
+            lo (Optional[int]): Limite inferior, None para começar do início
+            hi (Optional[int]): Limite superior, None para ir até o fim
+            inclusive (Tuple[bool, bool]): Se cada limite entra no intervalo
+            reverse (bool): Se True, a descida acha hi e o level 0 é seguido
+                pelos ponteiros backward, do maior para o menor (default False)
+
+        Yields:
+            Tuple[int, Any]: Os pares em ordem crescente de chave, ou
+            decrescente com reverse.
+        """
+        lo_inclusive, hi_inclusive = inclusive
+
+        if reverse:
+            yield from self._range_reversed(lo, hi, lo_inclusive, hi_inclusive)
+            return
+
+        if lo is None:
+            current = self.header.forward[0]
+        else:
+            current = self._first_from(lo, lo_inclusive)
+
         while current is not None:
-            items.append((current.key, current.value))
+            if hi is not None and (current.key > hi or
+                                   (current.key == hi and not hi_inclusive)):
+                return
+            if self.multimap:
+                for value in current.value:
+                    yield current.key, value
+            else:
+                yield current.key, current.value
             current = current.forward[0]
-        return items
+
+    def __iter__(self) -> Iterator[int]:
+        """Itera pelas chaves em ordem crescente."""
+        for key, _ in self.range():
+            yield key
+
+    def _range_reversed(self, lo: Optional[int], hi: Optional[int],
+                        lo_inclusive: bool, hi_inclusive: bool) -> Iterator[Tuple[int, Any]]:
+        """Metade decrescente do range, seguindo os ponteiros backward."""
+        if hi is None:
+            current = self._tail[0]
+            if current is self.header:
+                return
+        else:
+            current = self._last_before(hi, hi_inclusive)
+
+        while current is not None:
+            if lo is not None and (current.key < lo or
+                                   (current.key == lo and not lo_inclusive)):
+                return
+            if self.multimap:
+                for value in reversed(current.value):
+                    yield current.key, value
+            else:
+                yield current.key, current.value
+            current = current.backward
+
+    def __reversed__(self) -> Iterator[int]:
+        """Itera pelas chaves em ordem decrescente, pelos ponteiros backward."""
+        for key, _ in self._range_reversed(None, None, True, True):
+            yield key
 
     def __copy__(self) -> 'SkipList':
         """
@@ -219,8 +1487,9 @@ class SkipList:
             SkipList: Uma nova instância da SkipList com a mesma estrutura
         """
         # Criar nova skiplist com as mesmas configurações
-        new_skiplist = SkipList(max_level=self.max_level, p=self.p)
+        new_skiplist = self._empty_like()
         new_skiplist.level = self.level
+        new_skiplist._size = self._size
         
         # Se a skiplist original estiver vazia, retorna a nova vazia
         if self.header.forward[0] is None:
@@ -233,10 +1502,17 @@ class SkipList:
         current = self.header.forward[0]
         while current is not None:
             # Criar node copiado com o mesmo tamanho de forward que o original
-            copied_node = Node(current.key, current.value, len(current.forward))
+            value = list(current.value) if self.multimap else current.value
+            copied_node = Node(current.key, value, len(current.forward), self.indexable)
+            if self.indexable:
+                copied_node.width = list(current.width)
+            if current.backward is not None:
+                copied_node.backward = node_map[current.backward]
             node_map[current] = copied_node
             current = current.forward[0]
         
+        new_skiplist.header.width = list(self.header.width)
+
         # Agora reconectar todos os ponteiros
         # Primeiro, conectar o header aos primeiros nodes de cada nível
         for level in range(len(self.header.forward)):
@@ -256,11 +1532,454 @@ class SkipList:
                 # Se for None, já está None por padrão na inicialização
             
             current = current.forward[0]
+
+        node_map[self.header] = new_skiplist.header
+        new_skiplist._tail = [node_map[node] for node in self._tail]
+        new_skiplist._tail_rank = list(self._tail_rank)
+        new_skiplist._level_counts = list(self._level_counts)
+        new_skiplist._counts_stale = self._counts_stale
         
         return new_skiplist
 
 
 
+class TimeWindowSkipList(SkipList):
+    """
+    SkipList usada como índice de eventos por timestamp: as chaves são
+    instantes e os mais antigos saem em bloco. expire_before(t) corta todo
+    o prefixo com chaves menores que t religando só os ponteiros do header,
+    sem visitar os Nodes removidos. Opcionalmente a janela é mantida por
+    quantidade de elementos (max_entries) e/ou por idade em relação à
+    chave mais recente (max_age) em tudo que acrescenta elementos: insert,
+    from_sorted, join e as operações de conjunto.
+        - Expiração O(log n), independente de quantos elementos saem
+        - Inserção O(log n), mais O(1) amortizado por elemento expulso
+        - stats() O(n) na primeira chamada depois de uma expiração, que
+          não conta os Nodes removidos por level
+    """
+
+    def __init__(self, max_entries: Optional[int] = None,
+                 max_age: Optional[float] = None, **kwargs: Any):
+        """
+        Args:
+            max_entries (Optional[int]): Máximo de elementos; os mais antigos
+                que passarem disso são expulsos (default None)
+            max_age (Optional[float]): Idade máxima de uma chave em relação à
+                maior chave; as mais antigas expiram (default None)
+            **kwargs: Os mesmos argumentos do construtor da SkipList. Aqui
+                indexable é True por padrão: são as larguras que deixam o
+                expire_before independente de quantos elementos saem
+        """
+        kwargs.setdefault("indexable", True)
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[int, Any]],
+                    heights: str = "geometric", **kwargs: Any) -> 'TimeWindowSkipList':
+        """Carga em lote da SkipList, aplicando a janela no fim."""
+        skiplist = super().from_sorted(items, heights, **kwargs)
+        skiplist._enforce_window()
+        return skiplist
+
+    def _empty_like(self) -> 'TimeWindowSkipList':
+        """Cria uma skiplist vazia com as mesmas configurações e a mesma janela."""
+        new_skiplist = super()._empty_like()
+        new_skiplist.max_entries = self.max_entries
+        new_skiplist.max_age = self.max_age
+        return new_skiplist
+
+    def insert(self, key: int, value: Any) -> None:
+        """
+        Insere o par chave valor e aplica a janela.
+
+        Args:
+            key (int): Timestamp do evento
+            value (Any): Valor atribuído ao timestamp
+        """
+        super().insert(key, value)
+        self._enforce_window()
+
+    def join(self, other: 'SkipList') -> 'TimeWindowSkipList':
+        """Concatena other como na SkipList e aplica a janela no resultado."""
+        super().join(other)
+        self._enforce_window()
+        return self
+
+    def _merge(self, other: 'SkipList', keep_left: bool, keep_both: Optional[str],
+               keep_right: bool) -> 'TimeWindowSkipList':
+        """Merge da SkipList (union, intersection, difference) com a janela aplicada."""
+        result = super()._merge(other, keep_left, keep_both, keep_right)
+        result._enforce_window()
+        return result
+
+    def _enforce_window(self) -> None:
+        """
+        Expira as chaves mais velhas que max_age em relação à maior e depois
+        expulsa as mais antigas que passarem de max_entries.
+        """
+        if self._size == 0:
+            return
+
+        if self.max_age is not None:
+            cutoff = self._tail[0].key - self.max_age
+            if self.header.forward[0].key < cutoff:
+                self.expire_before(cutoff)
+
+        if self.max_entries is not None and self._size > self.max_entries:
+            self._evict_oldest(self._size - self.max_entries)
+
+    def expire_before(self, t: int) -> int:
+        """
+        Remove todas as chaves menores que t. Uma descida acha o último Node
+        antes de t em cada level e o header passa a apontar para o seguinte;
+        as larguras saem das posições da descida, então o custo não depende
+        de quantos elementos expiram (sem indexable a quantidade removida é
+        contada pelo level 0). A contagem de Nodes por level fica para ser
+        refeita pelo stats().
+
+        Args:
+            t (int): Primeiro timestamp que continua na skiplist
+
+        Returns:
+            int: Quantidade de elementos removidos.
+        """
+        update, rank = self._descend(t)
+        self._finger = None
+        removed = rank[0] if self.indexable else self._size_through(update[0])
+        if removed == 0:
+            return 0
+
+        header = self.header
+        for i in range(self.level + 1):
+            node = update[i]
+            following = node.forward[i]
+            if not self.indexable:
+                if node is not header:
+                    header.forward[i] = following
+                    if following is None:
+                        self._tail[i] = header
+                continue
+            if node is not header:
+                header.forward[i] = following
+                if following is not None:
+                    header.width[i] = rank[i] + node.width[i] - removed
+                else:
+                    header.width[i] = 0
+                    self._tail[i] = header
+                    self._tail_rank[i] = 0
+                    continue
+            elif following is not None:
+                header.width[i] -= removed
+            else:
+                continue
+            self._tail_rank[i] -= removed
+
+        if header.forward[0] is not None:
+            header.forward[0].backward = None
+        if self._cache is not None:
+            self._cache.clear()
+
+        self._counts_stale = True
+        self._trim_level()
+        self._size -= removed
+        if self.adaptive and self.shrink:
+            self._shrink()
+
+        return removed
+
+    def _evict_oldest(self, count: int) -> None:
+        """Expulsa os count elementos mais antigos, tirando Nodes do começo."""
+        self._finger = None
+        update = [self.header] * (self.max_level + 1)
+        rank = [0] * (self.max_level + 1)
+
+        while count > 0:
+            first = self.header.forward[0]
+            if self.multimap and len(first.value) > count:
+                del first.value[:count]
+                self._resize_node(update, -count)
+                return
+            count -= len(first.value) if self.multimap else 1
+            self._unlink(first, update, rank)
+
+
+class DeterministicNode:
+    """
+    Node da skiplist determinística. Cada level é uma lista simples e o
+    Node aponta para o próximo do mesmo level (right) e para o primeiro
+    Node do seu trecho no level de baixo (down). A chave de um Node acima
+    do level 1 é a maior chave do seu trecho; só o level 1 guarda valores.
+    """
+
+    __slots__ = ("key", "value", "right", "down")
+
+    def __init__(self, key: Any, value: Any, right: Optional['DeterministicNode'],
+                 down: Optional['DeterministicNode']):
+        """
+        Args:
+            key (Any): Chave do Node (os sentinelas usam +inf)
+            value (Any): Valor do Node, só usado no level 1
+            right (Optional[DeterministicNode]): Próximo Node do mesmo level
+            down (Optional[DeterministicNode]): Primeiro Node do trecho abaixo
+        """
+        self.key = key
+        self.value = value
+        self.right = right
+        self.down = down
+
+
+class DeterministicSkipList:
+    """
+    Skiplist 1-2-3 determinística (Munro, Papadakis e Sedgewick), sem
+    nenhum sorteio. Entre dois Nodes consecutivos de um level existem
+    sempre de 1 a 3 Nodes do level de baixo, então cada level tem no
+    máximo metade dos Nodes do anterior e uma descida anda no máximo
+    4 Nodes por level. Inserção e deleção são feitas de cima para baixo:
+    antes de descer, um trecho cheio é dividido (inserção) ou um trecho
+    com um único Node pega emprestado ou se junta a um vizinho (deleção).
+        - Pesquisa O(log n) no pior caso
+        - Inserção O(log n) no pior caso
+        - Deleção O(log n) no pior caso
+    """
+
+    def __init__(self):
+        """
+        Vai inicializar a skiplist vazia: o header é o Node +inf do level 1.
+        """
+        # bottom fecha os levels por baixo e tail por direita
+        self.bottom = DeterministicNode(None, None, None, None)
+        self.bottom.right = self.bottom.down = self.bottom
+        self.tail = DeterministicNode(float("inf"), None, None, None)
+        self.tail.right = self.tail
+        self.header = DeterministicNode(float("inf"), None, self.tail, self.bottom)
+        self.height = 1
+        self._size = 0
+
+    def _locate(self, key: int) -> DeterministicNode:
+        """Desce até o level 1 e retorna o primeiro Node com chave >= key."""
+        bottom = self.bottom
+        current = self.header
+
+        while current.down is not bottom:
+            while current.key < key:
+                current = current.right
+            current = current.down
+
+        while current.key < key:
+            current = current.right
+        return current
+
+    def search(self, key: int) -> Optional[Any]:
+        """
+        Procura uma chave descendo até o level 1, onde ficam os valores.
+
+        Args:
+            key (int): A chave que está sendo pesquisada.
+
+        Returns:
+            O valor associado a chave indicada, ou None.
+        """
+        current = self._locate(key)
+        return current.value if current.key == key else None
+
+    def insert(self, key: int, value: Any) -> bool:
+        """
+        Insere o par chave valor. Na descida, todo trecho com 3 Nodes entre
+        dois Nodes do level de cima promove o do meio, assim o trecho onde
+        a chave entra sempre tem espaço. Se a chave já existe, só troca o valor.
+
+        Args:
+            key (int): Chave que identifica o elemento
+            value (Any): Valor atribuído à chave
+
+        Returns:
+            bool: True se um elemento novo foi criado.
+        """
+        bottom = self.bottom
+        current = self.header
+
+        while True:
+            while current.key < key:
+                current = current.right
+            if current.down is bottom:
+                break
+
+            if current.down.right.right.key < current.key:
+                # Trecho cheio: o do meio sobe e o Node novo fica com a metade de cima
+                current.right = DeterministicNode(current.key, None, current.right,
+                                                  current.down.right.right)
+                current.key = current.down.right.key
+            else:
+                current = current.down
+
+        created = current.key != key
+        if created:
+            # O conteúdo de current vai para um Node novo logo depois e current
+            # fica com a chave nova, assim ninguém precisa conhecer o anterior
+            current.right = DeterministicNode(current.key, current.value,
+                                              current.right, bottom)
+            current.key = key
+            self._size += 1
+        current.value = value
+
+        # Topo dividido (mesmo que a chave já existisse): nasce um level novo
+        if self.header.right is not self.tail:
+            self.header = DeterministicNode(float("inf"), None, self.tail, self.header)
+            self.height += 1
+
+        return created
+
+    def delete(self, key: int) -> bool:
+        """
+        Remove uma chave. Na descida, todo trecho com um único Node a mais
+        que o Node de cima pega um emprestado do vizinho ou se junta a ele,
+        então o Node removido no level 1 nunca deixa um trecho vazio.
+
+        Args:
+            key (int): Chave que identifica o elemento a ser deletado.
+
+        Returns:
+            Retorna se conseguiu achar/deletar a chave indicada.
+        """
+        bottom = self.bottom
+        parent = self.header
+        if parent.down is bottom:
+            return False
+
+        # Nodes acima do level 1 cuja chave é key, renomeados no fim
+        renamed = []
+
+        while parent.down.down is not bottom:
+            previous = None
+            current = parent.down
+            while current.key < key:
+                previous = current
+                current = current.right
+
+            if current.down.right.key == current.key:
+                # Trecho mínimo: equilibra com um vizinho debaixo do mesmo parent
+                if current.key != parent.key:
+                    self._fix_with_right(current)
+                else:
+                    current = self._fix_with_left(previous, current)
+
+            if current.key == key:
+                renamed.append(current)
+            parent = current
+
+        previous = None
+        current = parent.down
+        while current.key < key:
+            previous = current
+            current = current.right
+
+        found = current.key == key
+        if found and current.key != parent.key:
+            # Copia o seguinte por cima e tira ele da lista: quem aponta
+            # para current, mesmo de outro trecho, continua certo
+            following = current.right
+            current.key = following.key
+            current.value = following.value
+            current.right = following.right
+        elif found:
+            previous.right = current.right
+            for node in renamed:
+                node.key = previous.key
+
+        # Os ajustes da descida podem ter deixado o topo com um só Node
+        while self.header.down is not bottom and self.header.down.right is self.tail:
+            self.header = self.header.down
+            self.height -= 1
+
+        if found:
+            self._size -= 1
+        return found
+
+    def _fix_with_right(self, current: DeterministicNode) -> None:
+        """Engorda o trecho de current com o primeiro Node do vizinho da direita."""
+        following = current.right
+        if following.down.right.key != following.key:
+            # Vizinho tem folga: empresta o primeiro Node
+            current.key = following.down.key
+            following.down = following.down.right
+        else:
+            # Os dois trechos são mínimos: viram um só
+            current.key = following.key
+            current.right = following.right
+
+    def _fix_with_left(self, previous: DeterministicNode,
+                       current: DeterministicNode) -> DeterministicNode:
+        """
+        Engorda o trecho de current com o último Node do vizinho da esquerda.
+
+        Returns:
+            DeterministicNode: O Node cujo trecho agora contém a chave.
+        """
+        if previous.down.right.key != previous.key:
+            # Vizinho tem folga: o último Node dele passa para current
+            last_but_one = previous.down
+            while last_but_one.right.key != previous.key:
+                last_but_one = last_but_one.right
+            current.down = last_but_one.right
+            previous.key = last_but_one.key
+            return current
+
+        previous.key = current.key
+        previous.right = current.right
+        return previous
+
+    def __contains__(self, key: int) -> bool:
+        """Check if key exists in the skiplist."""
+        return self._locate(key).key == key
+
+    def __len__(self) -> int:
+        """Return the number of elements in the skiplist."""
+        return self._size
+
+    def _first(self) -> DeterministicNode:
+        """Primeiro Node do level 1 (o +inf quando está vazia)."""
+        current = self.header
+        while current.down is not self.bottom:
+            current = current.down
+        return current
+
+    def __iter__(self) -> Iterator[int]:
+        """Itera pelas chaves em ordem crescente."""
+        current = self._first()
+        while current.right is not self.tail:
+            yield current.key
+            current = current.right
+
+    def items(self) -> List[tuple]:
+        """Return all key-value pairs in sorted order."""
+        items = []
+        current = self._first()
+        while current.right is not self.tail:
+            items.append((current.key, current.value))
+            current = current.right
+        return items
+
+    def keys(self) -> List[int]:
+        """Return all keys in sorted order."""
+        return list(self)
+
+    def display(self) -> None:
+        """Display the skiplist structure (for debugging)."""
+        print("Deterministic skiplist structure:")
+        start = self.header
+        for level in range(self.height, 0, -1):
+            print(f"Level {level}: ", end="")
+            current = start
+            while current is not self.tail:
+                print(current.key, end=" ")
+                current = current.right
+            print()
+            start = start.down
+
+
+
 import copy
 
 def test_skiplist_copy():
@@ -379,6 +2098,103 @@ def test_skiplist_copy():
 
 
 # Example usage and testing
+def test_deterministic_skiplist():
+    """
+    Confere a DeterministicSkipList depois de inserções e deleções
+    misturadas: as chaves, a busca e o invariante 1-2-3, isto é, entre
+    dois Nodes consecutivos de um level existem de 1 a 3 Nodes do level
+    de baixo.
+    """
+    print("=== Teste da DeterministicSkipList ===\n")
+
+    rng = Random(7)
+    deterministic = DeterministicSkipList()
+    expected = {}
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            deterministic.insert(key, f"v{key}")
+            expected[key] = f"v{key}"
+        else:
+            deterministic.delete(key)
+            expected.pop(key, None)
+
+    print(f"Tamanho: {len(deterministic)}, altura: {deterministic.height}")
+
+    # O trecho de um Node vai do seu down até o Node de baixo com a mesma
+    # chave; os Nodes do trecho que ficam entre ele e o anterior são o gap
+    gaps = []
+    level = deterministic.header.down
+    while level.down is not deterministic.bottom:
+        node = level
+        while node is not deterministic.tail:
+            below = node.down
+            gap = 0
+            while below.key != node.key:
+                below = below.right
+                gap += 1
+            gaps.append(gap)
+            node = node.right
+        level = level.down
+
+    keys_ok = deterministic.keys() == sorted(expected)
+    search_ok = all(deterministic.search(key) == expected.get(key) for key in range(300))
+    gaps_ok = all(1 <= gap <= 3 for gap in gaps)
+    print(f"Chaves iguais às esperadas: {keys_ok}")
+    print(f"Busca confere para todas as chaves: {search_ok}")
+    print(f"Tamanhos de gap encontrados: {sorted(set(gaps))}")
+    print(f"Todos os gaps entre 1 e 3: {gaps_ok}")
+    return keys_ok and search_ok and gaps_ok
+
+
+def test_indexable_skiplist():
+    """
+    Confere as larguras da SkipList com indexable=True depois de inserções
+    e deleções misturadas: a soma das larguras em cada level leva cada Node
+    à sua posição no level 0, e rank/select batem com a lista ordenada.
+    """
+    print("=== Teste da SkipList com indexable=True ===\n")
+
+    rng = Random(11)
+    skiplist = SkipList(max_level=8, indexable=True, seed=11)
+    expected = set()
+    for _ in range(2000):
+        key = rng.randrange(500)
+        if rng.random() < 0.6:
+            skiplist.insert(key, key * 10)
+            expected.add(key)
+        else:
+            skiplist.delete(key)
+            expected.discard(key)
+    expected = sorted(expected)
+
+    print(f"Tamanho: {len(skiplist)}, level: {skiplist.level}")
+
+    position = {}
+    node = skiplist.header.forward[0]
+    while node is not None:
+        position[node] = len(position) + 1
+        node = node.forward[0]
+
+    widths_ok = True
+    for i in range(skiplist.level + 1):
+        node = skiplist.header
+        pos = 0
+        while node.forward[i] is not None:
+            pos += node.width[i]
+            node = node.forward[i]
+            widths_ok = widths_ok and pos == position[node]
+
+    rank_ok = all(skiplist.rank(key) == index for index, key in enumerate(expected))
+    select_ok = all(skiplist.select(index) == (key, key * 10)
+                    for index, key in enumerate(expected))
+    print(f"Chaves iguais às esperadas: {skiplist.keys() == expected}")
+    print(f"Larguras levam cada Node à sua posição: {widths_ok}")
+    print(f"rank confere: {rank_ok}")
+    print(f"select confere: {select_ok}")
+    return skiplist.keys() == expected and widths_ok and rank_ok and select_ok
+
+
 if __name__ == "__main__":
     # Create skiplist
     sl = SkipList()
@@ -419,4 +2235,10 @@ if __name__ == "__main__":
     sl.display()
 
     
-    test_skiplist_copy()
\ No newline at end of file
+    test_skiplist_copy()
+
+    print()
+    deterministic_ok = test_deterministic_skiplist()
+    print()
+    indexable_ok = test_indexable_skiplist()
+    print(f"\nVerificações da determinística e das larguras passaram: {deterministic_ok and indexable_ok}")
@@ -0,0 +1,332 @@
+from typing import Optional, List, Any, Iterator, Tuple
+from bisect import bisect_left, bisect_right
+from random import Random
+
+from src.edas.skiplist import GeometricLevels
+
+
+class Block:
+    """
+    Um Block guarda um pequeno trecho ordenado de chaves e valores em listas
+    paralelas. Só os Blocks são promovidos para as lanes de cima, usando a
+    menor chave do trecho como referência, então cada chave deixa de ter
+    um objeto e um forward próprios.
+    """
+
+    __slots__ = ("keys", "values", "forward")
+
+    def __init__(self, keys: List[int], values: List[Any], level: int = 1):
+        """
+        Args:
+            keys (List[int]): Chaves do trecho, em ordem crescente
+            values (List[Any]): Valores na mesma ordem das chaves
+            level (int): Tamanho de layers que podem ser atribuídos ao Block
+        """
+        self.keys = keys
+        self.values = values
+        self.forward: List[Optional['Block']] = [None] * level
+
+
+class UnrolledSkipList:
+    """
+    Skiplist desenrolada: o level 0 é uma lista de Blocks com até capacity
+    chaves cada, buscadas com bisect. Um Block cheio se divide ao meio e um
+    Block com menos de capacity/4 chaves se junta com o seguinte.
+    Com n chaves e blocos de tamanho b, a estrutura tem cerca de n/b torres,
+    o que reduz a memória por chave e os saltos de ponteiro no level 0.
+        - Pesquisa O(log n)
+        - Inserção O(log n + b)
+        - Deleção O(log n + b)
+    """
+
+    def __init__(self, capacity: int = 64, max_level: int = 16, p: float = 0.5,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            capacity (int): Máximo de chaves por Block (default 64)
+            max_level (int): O número máximo de levels da estrutura (default 16)
+            p (float): O fator aleatório que promove um Block (default 0.5)
+            seed (Optional[int]): Seed do gerador de levels (default None)
+        """
+        if capacity < 4:
+            raise ValueError("capacity precisa ser pelo menos 4")
+
+        self.capacity = capacity
+        self.max_level = max_level
+        self.p = p
+        self.seed = seed
+        self.level = 0 # maior level registrado
+        self._size = 0
+        self._level_generator = GeometricLevels(p, Random(seed))
+
+        self.header = Block([], [], self.max_level + 1)
+
+    def _find(self, key: int, strict: bool = False) -> List[Block]:
+        """
+        Encontra, em cada level, o último Block cuja menor chave é menor ou
+        igual a key (ou estritamente menor, se strict).
+        """
+        update: List[Block] = [self.header] * (self.max_level + 1)
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while current.forward[i] is not None and (
+                    current.forward[i].keys[0] < key if strict
+                    else current.forward[i].keys[0] <= key):
+                current = current.forward[i]
+            update[i] = current
+
+        return update
+
+    def _locate(self, key: int) -> Optional[Block]:
+        """Retorna o Block onde key está ou deveria estar."""
+        current = self.header
+
+        for i in range(self.level, -1, -1):
+            while (current.forward[i] is not None and
+                   current.forward[i].keys[0] <= key):
+                current = current.forward[i]
+
+        # Chave menor que todas: o lugar dela é o primeiro Block
+        return current if current is not self.header else current.forward[0]
+
+    def search(self, key: int) -> Optional[Any]:
+        """
+        Procura uma chave: descida pelos Blocks e bisect dentro do trecho.
+
+        Args:
+            key (int): A chave que está sendo pesquisada.
+
+        Returns:
+            O valor associado a chave indicada, ou None.
+        """
+        block = self._locate(key)
+        if block is None:
+            return None
+
+        i = bisect_left(block.keys, key)
+        if i < len(block.keys) and block.keys[i] == key:
+            return block.values[i]
+        return None
+
+    def insert(self, key: int, value: Any) -> None:
+        """
+        Insere o par chave valor no Block adequado, dividindo-o se passar
+        da capacidade. Só o novo Block da divisão sorteia um level.
+
+        Args:
+            key (int): Chave que identifica o elemento
+            value (Any): Valor atribuído à chave
+        """
+        update = self._find(key)
+        block = update[0]
+
+        if block is self.header:
+            block = self.header.forward[0]
+            if block is None:
+                # Estrutura vazia: o primeiro Block nasce no level 0
+                block = Block([key], [value], 1)
+                self.header.forward[0] = block
+                self._size += 1
+                return
+            # key vai para o início do primeiro Block, que continua antes de tudo
+            for i in range(self.level + 1):
+                if self.header.forward[i] is block:
+                    update[i] = block
+
+        i = bisect_left(block.keys, key)
+        if i < len(block.keys) and block.keys[i] == key:
+            block.values[i] = value
+            return
+
+        block.keys.insert(i, key)
+        block.values.insert(i, value)
+        self._size += 1
+
+        if len(block.keys) > self.capacity:
+            self._split(block, update)
+
+    def _split(self, block: Block, update: List[Block]) -> None:
+        """
+        Divide um Block cheio ao meio; a metade de cima vira um novo Block
+        logo depois dele, ligado nos levels sorteados.
+        """
+        mid = len(block.keys) // 2
+        new_level = self._level_generator(self.max_level)
+
+        if new_level > self.level:
+            for i in range(self.level + 1, new_level + 1):
+                update[i] = self.header
+            self.level = new_level
+
+        new_block = Block(block.keys[mid:], block.values[mid:], new_level + 1)
+        del block.keys[mid:]
+        del block.values[mid:]
+
+        for i in range(new_level + 1):
+            # No level 0 o novo Block entra logo depois do que foi dividido
+            previous = block if i == 0 or len(block.forward) > i else update[i]
+            new_block.forward[i] = previous.forward[i]
+            previous.forward[i] = new_block
+
+    def delete(self, key: int) -> bool:
+        """
+        Remove uma chave. Um Block vazio sai da estrutura e um Block com
+        menos de capacity/4 chaves absorve o seguinte quando cabem juntos.
+
+        Args:
+            key (int): Chave que identifica o elemento a ser deletado.
+
+        Returns:
+            Retorna se conseguiu achar/deletar a chave indicada.
+        """
+        block = self._locate(key)
+        if block is None:
+            return False
+
+        i = bisect_left(block.keys, key)
+        if i == len(block.keys) or block.keys[i] != key:
+            return False
+
+        first_key = block.keys[0]
+        self._size -= 1
+
+        if len(block.keys) == 1:
+            self._unlink(block, first_key)
+            return True
+
+        del block.keys[i]
+        del block.values[i]
+
+        following = block.forward[0]
+        if (len(block.keys) < self.capacity // 4 and following is not None and
+                len(block.keys) + len(following.keys) <= self.capacity):
+            self._unlink(following, following.keys[0])
+            block.keys.extend(following.keys)
+            block.values.extend(following.values)
+
+        return True
+
+    def _unlink(self, block: Block, first_key: int) -> None:
+        """Tira um Block de todas as lanes em que ele aparece."""
+        update = self._find(first_key, strict=True)
+
+        for i in range(len(block.forward)):
+            if update[i].forward[i] is block:
+                update[i].forward[i] = block.forward[i]
+
+        while self.level > 0 and self.header.forward[self.level] is None:
+            self.level -= 1
+
+    def __contains__(self, key: int) -> bool:
+        """Check if key exists in the skiplist."""
+        return self.search(key) is not None
+
+    def __len__(self) -> int:
+        """Return the number of keys in the skiplist."""
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """Itera pelas chaves em ordem crescente."""
+        block = self.header.forward[0]
+        while block is not None:
+            yield from block.keys
+            block = block.forward[0]
+
+    def range(self, lo: int, hi: int) -> Iterator[Tuple[int, Any]]:
+        """
+        Percorre os pares (chave, valor) do intervalo fechado [lo, hi]
+        a partir de uma única descida.
+        """
+        block = self._locate(lo)
+        if block is None:
+            return
+
+        i = bisect_left(block.keys, lo)
+        while block is not None:
+            end = bisect_right(block.keys, hi)
+            for j in range(i, end):
+                yield block.keys[j], block.values[j]
+            if end < len(block.keys):
+                return
+            block = block.forward[0]
+            i = 0
+
+    def keys(self) -> List[int]:
+        """Return all keys in sorted order."""
+        return list(self)
+
+    def items(self) -> List[tuple]:
+        """Return all key-value pairs in sorted order."""
+        items = []
+        block = self.header.forward[0]
+        while block is not None:
+            items.extend(zip(block.keys, block.values))
+            block = block.forward[0]
+        return items
+
+    def block_count(self) -> int:
+        """Quantidade de Blocks no level 0."""
+        count = 0
+        block = self.header.forward[0]
+        while block is not None:
+            count += 1
+            block = block.forward[0]
+        return count
+
+    def display(self) -> None:
+        """Display the block structure (for debugging)."""
+        print("Unrolled skiplist structure:")
+        for level in range(self.level, -1, -1):
+            print(f"Level {level}: ", end="")
+            block = self.header.forward[level]
+            while block is not None:
+                print(block.keys, end=" ")
+                block = block.forward[level]
+            print()
+
+    def __copy__(self) -> 'UnrolledSkipList':
+        """
+        Cria uma cópia independente, com os mesmos Blocks e as mesmas torres.
+
+        Returns:
+            UnrolledSkipList: Uma nova instância com a mesma estrutura
+        """
+        new_list = UnrolledSkipList(capacity=self.capacity, max_level=self.max_level,
+                                    p=self.p, seed=self.seed)
+        new_list.level = self.level
+        new_list._size = self._size
+
+        block_map = {self.header: new_list.header}
+        block = self.header.forward[0]
+        while block is not None:
+            block_map[block] = Block(list(block.keys), list(block.values),
+                                     len(block.forward))
+            block = block.forward[0]
+
+        for original, copied in block_map.items():
+            for i, following in enumerate(original.forward):
+                if following is not None:
+                    copied.forward[i] = block_map[following]
+
+        return new_list
+
+
+if __name__ == "__main__":
+    usl = UnrolledSkipList(capacity=4)
+
+    print("Inserting elements...")
+    for key in [5, 1, 9, 3, 7, 2, 8, 4, 6, 10, 0]:
+        usl.insert(key, str(key))
+
+    usl.display()
+    print(f"\nSize: {len(usl)}, blocks: {usl.block_count()}")
+    print(f"Search 7: {usl.search(7)}")
+    print(f"Range [3, 6]: {list(usl.range(3, 6))}")
+
+    print("\nDeleting elements...")
+    for key in [0, 1, 2, 3, 11]:
+        print(f"Delete {key}: {'Success' if usl.delete(key) else 'Not found'}")
+
+    usl.display()
+    print(f"\nFinal keys: {usl.keys()}")
@@ -3,10 +3,6 @@ import time
 import copy
 import csv
 from typing import List
-import sys
-
-# Aumentando o limite de recursão para árvores grandes, pois ocorreram alguns bugs
-sys.setrecursionlimit(200000)
 
 from src.data_structures.avl import AVLTree
 
@@ -0,0 +1,109 @@
+import os
+import time
+import csv
+import random
+from typing import List
+
+from src.edas.avl import AVLTree
+
+SEED = 42
+
+
+def timed(operation) -> float:
+    """Executa a operação e retorna o tempo gasto em milissegundos."""
+    start_time = time.perf_counter()
+    operation()
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def add_missing(tree: AVLTree, values: List[int]) -> None:
+    """União feita com um add por valor que ainda não está na árvore."""
+    for value in values:
+        if tree.search(value) is None:
+            tree.add(value)
+
+def remove_all(tree: AVLTree, values: List[int]) -> None:
+    """Diferença feita com um remove por valor."""
+    for value in values:
+        tree.remove(value)
+
+def keep_found(tree: AVLTree, values: List[int]) -> AVLTree:
+    """Interseção feita buscando cada valor e montando a árvore do zero."""
+    return AVLTree.from_sorted(sorted(value for value in values if tree.search(value) is not None))
+
+def copy_and_add(tree: AVLTree, values: List[int]) -> AVLTree:
+    """União sem alterar as entradas: cópia da árvore maior e um add por valor."""
+    result = tree.copy()
+    add_missing(result, values)
+    return result
+
+
+def main():
+    """
+    Compara as operações de conjunto da AVLTree com o caminho de uma
+    operação por valor, juntando um delta de tamanho m a uma árvore base
+    de tamanho n. As versões *_update só leem o delta e alteram a base.
+    """
+
+    MEASUREMENT_PATH = "measurements"
+    BASE_SIZE = int(os.getenv("SETOPS_BASE_SIZE", "1000000"))
+    DELTA_SIZES = [int(x) for x in os.getenv("SETOPS_DELTA_SIZES", "1000 10000 100000 1000000").split()]
+
+    print("Iniciando medição das operações de conjunto da AVL...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+    rng = random.Random(SEED)
+    universe = BASE_SIZE * 10
+    base = AVLTree.from_sorted(sorted(rng.sample(range(universe), BASE_SIZE)))
+
+    for delta_size in DELTA_SIZES:
+        values = rng.sample(range(universe), delta_size)
+        delta = AVLTree.from_sorted(sorted(values))
+
+        print(f"\n--- Base de {BASE_SIZE} valores, delta de {delta_size} ---")
+
+        # Cada par é (método de conjunto, equivalente com uma operação por valor)
+        cases = {
+            'union': (lambda tree: tree.union(delta),
+                      lambda tree: copy_and_add(tree, values)),
+            'union_update': (lambda tree: tree.union_update(delta),
+                             lambda tree: add_missing(tree, values)),
+            'intersection_update': (lambda tree: tree.intersection_update(delta),
+                                    lambda tree: keep_found(tree, values)),
+            'difference_update': (lambda tree: tree.difference_update(delta),
+                                  lambda tree: remove_all(tree, values)),
+        }
+
+        for operation, (set_method, per_value) in cases.items():
+            times = {}
+            for method, run in (('set', set_method), ('per_value', per_value)):
+                tree = base.copy() # as versões *_update alteram a base
+                times[method] = timed(lambda: run(tree))
+                all_results.append({'base_size': BASE_SIZE, 'delta_size': delta_size,
+                                    'operation': operation, 'method': method,
+                                    'time_ms': times[method]})
+
+            print(f"   -> {operation:<20}: {times['set']:.4f} ms contra "
+                  f"{times['per_value']:.4f} ms por valor")
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "avl_setops_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['base_size', 'delta_size', 'operation',
+                                                   'method', 'time_ms'])
+            writer.writeheader()
+            writer.writerows(all_results)
+
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
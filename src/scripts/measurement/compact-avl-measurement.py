@@ -0,0 +1,99 @@
+import os
+import time
+import csv
+import random
+import tracemalloc
+from typing import List
+
+from src.edas.avl import AVLTree, CompactAVLTree
+
+SEED = 42
+
+
+def build(structure, data: List[int]):
+    """Monta a árvore inserindo os elementos um a um."""
+    tree = structure()
+    for item in data:
+        tree.add(item)
+    return tree
+
+def measure_insertion(structure, data: List[int]) -> float:
+    """Mede o tempo para inserir todos os elementos de uma amostra em uma árvore vazia."""
+    start_time = time.perf_counter()
+    build(structure, data)
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_search(data: List[int], populated_tree) -> float:
+    """Mede o tempo para buscar todos os elementos de uma amostra em uma árvore pré-populada."""
+    start_time = time.perf_counter()
+    
+    for item in data:
+        populated_tree.search(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_memory(structure, data: List[int]) -> int:
+    """Bytes alocados pela árvore montada, medidos com o tracemalloc."""
+    tracemalloc.start()
+    tree = build(structure, data)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return allocated
+
+
+def main():
+    """
+    Compara a memória por chave da AVLTree (um objeto Node por valor) com
+    a CompactAVLTree (colunas de array), até 1M de inteiros aleatórios.
+    """
+
+    MEASUREMENT_PATH = "measurements"
+    SIZES = [int(x) for x in os.getenv("COMPACT_SIZES", "10000 100000 1000000").split()]
+    STRUCTURES = {'AVLTree': AVLTree, 'CompactAVLTree': CompactAVLTree}
+
+    print("Iniciando medição de memória da AVL compacta...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+    rng = random.Random(SEED)
+
+    for size in SIZES:
+        data = rng.sample(range(size * 10), size)
+
+        print(f"\n--- Medindo {size} inteiros aleatórios ---")
+
+        for name, structure in STRUCTURES.items():
+            memory = measure_memory(structure, data)
+            insertion = measure_insertion(structure, data)
+            search = measure_search(data, build(structure, data))
+
+            print(f"   -> {name:<14}: {memory / size:.1f} bytes/chave, "
+                  f"inserção {insertion:.4f} ms, busca {search:.4f} ms")
+
+            all_results.append({'structure': name, 'size': size, 'memory_bytes': memory,
+                                'bytes_per_key': memory / size,
+                                'insertion_ms': insertion, 'search_ms': search})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "compact_avl_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+        
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['structure', 'size', 'memory_bytes', 'bytes_per_key',
+                                                   'insertion_ms', 'search_ms'])
+            writer.writeheader()
+            writer.writerows(all_results)
+        
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
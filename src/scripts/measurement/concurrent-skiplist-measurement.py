@@ -0,0 +1,133 @@
+import os
+import time
+import csv
+import random
+import threading
+from typing import List
+
+from src.edas.concurrent_skiplist import ConcurrentSkipList
+
+SEED = 42
+
+
+def worker(skiplist: ConcurrentSkipList, data: List[int], num_ops: int,
+           read_ratio: float, seed: int, barrier: threading.Barrier) -> None:
+    """Executa num_ops operações mistas (busca, inserção ou deleção) sobre chaves da amostra."""
+    rng = random.Random(seed)
+    write_cut = read_ratio + (1 - read_ratio) / 2
+    ops = []
+    for _ in range(num_ops):
+        roll = rng.random()
+        op = "search" if roll < read_ratio else "insert" if roll < write_cut else "delete"
+        ops.append((op, rng.choice(data)))
+
+    search, insert, delete = skiplist.search, skiplist.insert, skiplist.delete
+
+    barrier.wait()
+    for op, key in ops:
+        if op == "search":
+            search(key)
+        elif op == "insert":
+            insert(key, key)
+        else:
+            delete(key)
+
+def measure_throughput(data: List[int], num_threads: int, read_ratio: float,
+                       ops_per_thread: int) -> float:
+    """Mede quantas operações por segundo as threads completam juntas em uma skiplist pré-populada."""
+    skiplist = ConcurrentSkipList(seed=SEED)
+    for item in data:
+        skiplist.insert(item, item)
+
+    barrier = threading.Barrier(num_threads + 1)
+    threads = [threading.Thread(target=worker,
+                                args=(skiplist, data, ops_per_thread, read_ratio, SEED + i, barrier))
+               for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    end_time = time.perf_counter()
+
+    return num_threads * ops_per_thread / (end_time - start_time)
+
+
+def main():
+    """
+    Mede a vazão da ConcurrentSkipList com 1, 2, 4 e 8 threads e diferentes
+    proporções de leitura e escrita. Em CPython com GIL as threads não rodam
+    em paralelo; o ganho de escala só aparece no build free-threaded (3.13t+).
+    """
+
+    SAMPLE_PATH = os.getenv("SAMPLE_RELATIVE_PATH", "samples")
+    MEASUREMENT_PATH = "measurements"
+    SAMPLE_FILES = ["samples-sequential.txt", "samples-random.txt"]
+    THREAD_COUNTS = [1, 2, 4, 8]
+    READ_RATIOS = [0.5, 0.9, 0.99]
+    OPS_PER_THREAD = 20000
+    NUM_RUNS = 3
+
+    print("Iniciando medição de vazão da ConcurrentSkipList...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+
+    for filename in SAMPLE_FILES:
+        sample_type = "sequential" if "sequential" in filename else "random"
+        filepath = os.path.join(SAMPLE_PATH, filename)
+        
+        print(f"\n{'='*50}")
+        print(f"Processando arquivo de amostras: {filename}")
+        print(f"{'='*50}")
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"ERRO: Arquivo de amostra não encontrado em '{filepath}'.")
+            continue
+
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            data = [int(x) for x in line.strip().split()]
+            sample_size = len(data)
+
+            print(f"\n--- Medindo Amostra {sample_type.capitalize()} (Tamanho: {sample_size}) ---")
+
+            for read_ratio in READ_RATIOS:
+                for num_threads in THREAD_COUNTS:
+                    runs = [measure_throughput(data, num_threads, read_ratio, OPS_PER_THREAD)
+                            for _ in range(NUM_RUNS)]
+                    avg_throughput = sum(runs) / NUM_RUNS
+
+                    print(f"   -> {num_threads} thread(s), {read_ratio:.0%} leituras: "
+                          f"{avg_throughput:,.0f} ops/s")
+
+                    all_results.append({'sample_type': sample_type, 'size': sample_size,
+                                        'threads': num_threads, 'read_ratio': read_ratio,
+                                        'ops_per_sec': avg_throughput})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "concurrent_skiplist_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+        
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'threads', 'read_ratio', 'ops_per_sec'])
+            writer.writeheader()
+            writer.writerows(all_results)
+        
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado. Verifique os arquivos de amostra.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import os
+import time
+import csv
+import random
+from itertools import accumulate
+from typing import List
+
+from src.edas.skiplist import SkipList
+
+SEED = 42
+
+
+def zipf_queries(data: List[int], num_queries: int, s: float = 1.1) -> List[int]:
+    """Sorteia consultas com distribuição zipfiana: a chave de posição r sai com peso 1/r^s."""
+    rng = random.Random(SEED)
+    keys = rng.sample(data, len(data)) # a popularidade não segue a ordem das chaves
+    cum_weights = list(accumulate(1 / rank ** s for rank in range(1, len(keys) + 1)))
+    return rng.choices(keys, cum_weights=cum_weights, k=num_queries)
+
+def measure_search(queries: List[int], populated_list: SkipList) -> float:
+    """Mede o tempo para fazer todas as consultas em uma SkipList pré-populada."""
+    start_time = time.perf_counter()
+    
+    for item in queries:
+        populated_list.search(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+
+def main():
+    """
+    Compara a busca sem cache e com caches de diferentes tamanhos
+    (fração do número de chaves) sob uma carga zipfiana.
+    """
+
+    SAMPLE_PATH = os.getenv("SAMPLE_RELATIVE_PATH", "samples")
+    MEASUREMENT_PATH = "measurements"
+    SAMPLE_FILES = ["samples-sequential.txt", "samples-random.txt"]
+    CACHE_FRACTIONS = [0, 0.001, 0.01, 0.05]
+    NUM_RUNS = 5
+
+    print("Iniciando medição da SkipList com cache de chaves quentes...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+
+    for filename in SAMPLE_FILES:
+        sample_type = "sequential" if "sequential" in filename else "random"
+        filepath = os.path.join(SAMPLE_PATH, filename)
+        
+        print(f"\n{'='*50}")
+        print(f"Processando arquivo de amostras: {filename}")
+        print(f"{'='*50}")
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"ERRO: Arquivo de amostra não encontrado em '{filepath}'.")
+            continue
+
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            data = [int(x) for x in line.strip().split()]
+            sample_size = len(data)
+            queries = zipf_queries(data, sample_size)
+
+            print(f"\n--- Medindo Amostra {sample_type.capitalize()} (Tamanho: {sample_size}) ---")
+
+            for fraction in CACHE_FRACTIONS:
+                cache_size = int(sample_size * fraction)
+                search_times = []
+                hit_rates = []
+
+                for i in range(NUM_RUNS):
+                    populated_skiplist = SkipList(adaptive=True, seed=SEED, cache_size=cache_size)
+                    for item in data:
+                        populated_skiplist.insert(item, item)
+                    search_times.append(measure_search(queries, populated_skiplist))
+                    hit_rates.append(populated_skiplist.cache_info()["hit_rate"])
+
+                avg_search = sum(search_times) / NUM_RUNS
+                avg_hit_rate = sum(hit_rates) / NUM_RUNS
+
+                print(f"   -> Cache {cache_size:>6} entradas: busca {avg_search:.4f} ms, "
+                      f"acertos {avg_hit_rate:.1%}")
+
+                all_results.append({'sample_type': sample_type, 'size': sample_size,
+                                    'cache_size': cache_size, 'hit_rate': avg_hit_rate,
+                                    'time_ms': avg_search})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "skiplist_cache_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+        
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'cache_size', 'hit_rate', 'time_ms'])
+            writer.writeheader()
+            writer.writerows(all_results)
+        
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado. Verifique os arquivos de amostra.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import os
+import time
+import csv
+from typing import List, Dict
+
+from src.edas.skiplist import SkipList, DeterministicSkipList
+
+SEED = 42
+
+
+def percentile(samples: List[int], fraction: float) -> float:
+    """Percentil por posição numa lista já ordenada (em nanossegundos)."""
+    index = min(len(samples) - 1, int(fraction * len(samples)))
+    return samples[index]
+
+def measure_latencies(data: List[int], structure) -> Dict[str, List[int]]:
+    """
+    Mede a latência individual de cada inserção, busca e deleção, em
+    nanossegundos, na ordem das amostras.
+    """
+    latencies = {'insert': [], 'search': [], 'delete': []}
+    clock = time.perf_counter_ns
+
+    for item in data:
+        start = clock()
+        structure.insert(item, item)
+        latencies['insert'].append(clock() - start)
+
+    for item in data:
+        start = clock()
+        structure.search(item)
+        latencies['search'].append(clock() - start)
+
+    for item in data:
+        start = clock()
+        structure.delete(item)
+        latencies['delete'].append(clock() - start)
+
+    return latencies
+
+
+def main():
+    """
+    Compara a latência por operação (p50, p99 e máximo) da SkipList
+    aleatória com a skiplist determinística 1-2-3.
+    """
+
+    SAMPLE_PATH = os.getenv("SAMPLE_RELATIVE_PATH", "samples")
+    MEASUREMENT_PATH = "measurements"
+    SAMPLE_FILES = ["samples-sequential.txt", "samples-random.txt"]
+    STRUCTURES = {
+        'randomized': lambda: SkipList(adaptive=True, seed=SEED),
+        'deterministic': DeterministicSkipList,
+    }
+    NUM_RUNS = 5
+
+    print("Iniciando medição de latência da skiplist determinística...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+
+    for filename in SAMPLE_FILES:
+        sample_type = "sequential" if "sequential" in filename else "random"
+        filepath = os.path.join(SAMPLE_PATH, filename)
+        
+        print(f"\n{'='*50}")
+        print(f"Processando arquivo de amostras: {filename}")
+        print(f"{'='*50}")
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"ERRO: Arquivo de amostra não encontrado em '{filepath}'.")
+            continue
+
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            data = [int(x) for x in line.strip().split()]
+            sample_size = len(data)
+
+            print(f"\n--- Medindo Amostra {sample_type.capitalize()} (Tamanho: {sample_size}) ---")
+
+            for name, factory in STRUCTURES.items():
+                # As latências de todas as execuções entram juntas nos percentis
+                merged = {'insert': [], 'search': [], 'delete': []}
+                for i in range(NUM_RUNS):
+                    for operation, samples in measure_latencies(data, factory()).items():
+                        merged[operation].extend(samples)
+
+                for operation, samples in merged.items():
+                    samples.sort()
+                    p50 = percentile(samples, 0.50) / 1000
+                    p99 = percentile(samples, 0.99) / 1000
+                    worst = samples[-1] / 1000
+
+                    print(f"   -> {name:<13} {operation:<6}: p50 {p50:.2f} us, "
+                          f"p99 {p99:.2f} us, max {worst:.2f} us")
+
+                    all_results.append({'sample_type': sample_type, 'size': sample_size,
+                                        'structure': name, 'operation': operation,
+                                        'p50_us': p50, 'p99_us': p99, 'max_us': worst})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "skiplist_deterministic_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+        
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'structure', 'operation',
+                                                   'p50_us', 'p99_us', 'max_us'])
+            writer.writeheader()
+            writer.writerows(all_results)
+        
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado. Verifique os arquivos de amostra.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import os
+import time
+import csv
+import random
+from typing import List
+
+from src.edas.skiplist import SkipList
+
+SEED = 42
+
+def build_skiplist(data: List[int], finger: bool) -> SkipList:
+    """Monta uma SkipList adaptativa com todos os elementos da amostra."""
+    sl = SkipList(adaptive=True, finger=finger, seed=SEED)
+    for item in data:
+        sl.insert(item, item)
+    return sl
+
+def measure_insertion(base: List[int], data: List[int], finger: bool) -> float:
+    """
+    Mede o tempo para inserir data, na ordem dada, em uma SkipList que já
+    tem base. As chaves de data ficam entre as de base, então as inserções
+    descem pela estrutura em vez de cair no atalho de anexar no fim.
+    """
+    sl = build_skiplist(base, finger)
+    start_time = time.perf_counter()
+    
+    for item in data:
+        sl.insert(item, item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_search(queries: List[int], populated_list: SkipList) -> float:
+    """Mede o tempo para buscar todas as chaves, na ordem dada, em uma SkipList pré-populada."""
+    start_time = time.perf_counter()
+    
+    for item in queries:
+        populated_list.search(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+
+def main():
+    """
+    Compara a busca e a inserção com e sem finger para operações em ordem
+    crescente (localidade máxima) e em ordem aleatória (sem localidade).
+    Em ordem crescente numa lista vazia toda inserção anexaria no fim sem
+    descer, então a inserção é medida com metade das chaves já na lista e
+    a outra metade entrando entre elas.
+    """
+
+    SAMPLE_PATH = os.getenv("SAMPLE_RELATIVE_PATH", "samples")
+    MEASUREMENT_PATH = "measurements"
+    SAMPLE_FILES = ["samples-sequential.txt", "samples-random.txt"]
+    NUM_RUNS = 5
+
+    print("Iniciando medição da SkipList com finger search...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+
+    for filename in SAMPLE_FILES:
+        sample_type = "sequential" if "sequential" in filename else "random"
+        filepath = os.path.join(SAMPLE_PATH, filename)
+        
+        print(f"\n{'='*50}")
+        print(f"Processando arquivo de amostras: {filename}")
+        print(f"{'='*50}")
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"ERRO: Arquivo de amostra não encontrado em '{filepath}'.")
+            continue
+
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            data = [int(x) for x in line.strip().split()]
+            sample_size = len(data)
+
+            orders = {
+                "sequential": sorted(data),
+                "random": random.Random(SEED).sample(data, sample_size),
+            }
+            # Chaves alternadas: as de posição par já estão na lista e as
+            # de posição ímpar são inseridas na ordem de cada consulta
+            base_keys, new_keys = orders["sequential"][::2], orders["sequential"][1::2]
+            insertion_orders = {
+                "sequential": new_keys,
+                "random": random.Random(SEED).sample(new_keys, len(new_keys)),
+            }
+
+            print(f"\n--- Medindo Amostra {sample_type.capitalize()} (Tamanho: {sample_size}) ---")
+
+            for finger in (False, True):
+                populated_skiplist = build_skiplist(data, finger)
+
+                for query_order, queries in orders.items():
+                    insertion_times, search_times = [], []
+
+                    for i in range(NUM_RUNS):
+                        insertion_times.append(measure_insertion(
+                            base_keys, insertion_orders[query_order], finger))
+                        search_times.append(measure_search(queries, populated_skiplist))
+
+                    avg_insertion = sum(insertion_times) / NUM_RUNS
+                    avg_search = sum(search_times) / NUM_RUNS
+
+                    label = "com finger" if finger else "sem finger"
+                    print(f"   -> Consultas {query_order} {label}: "
+                          f"inserção {avg_insertion:.4f} ms, busca {avg_search:.4f} ms")
+
+                    base = {'sample_type': sample_type, 'size': sample_size,
+                            'query_order': query_order, 'finger': finger}
+                    all_results.append({**base, 'operation': 'insertion', 'time_ms': avg_insertion})
+                    all_results.append({**base, 'operation': 'search', 'time_ms': avg_search})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "skiplist_finger_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+        
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'query_order', 'finger', 'operation', 'time_ms'])
+            writer.writeheader()
+            writer.writerows(all_results)
+        
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado. Verifique os arquivos de amostra.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import os
+import csv
+import timeit
+from random import Random, random
+
+from src.edas.skiplist import SkipList, GeometricLevels
+
+SEED = 42
+
+
+class LoopLevels:
+    """O sorteio original da SkipList: um random() por level promovido."""
+
+    def __init__(self, p: float, max_level: int):
+        self.p = p
+        self.max_level = max_level
+
+    def _random_level(self) -> int:
+        level = 0
+        while random() < self.p and level < self.max_level:
+            level += 1
+        return level
+
+
+def measure(draws: dict, number: int, repeat: int) -> dict:
+    """
+    Menor tempo médio por chamada de cada sorteio, em nanossegundos. As
+    repetições são intercaladas entre os sorteios para que o ruído da
+    máquina afete todos da mesma forma.
+    """
+    best = {name: float('inf') for name in draws}
+    for _ in range(repeat):
+        for name, draw in draws.items():
+            elapsed = timeit.timeit(draw, number=number) / number * 1e9
+            best[name] = min(best[name], elapsed)
+    return best
+
+
+def main():
+    """
+    Compara o custo por chamada do sorteio de level: o laço original com
+    random(), o GeometricLevels chamado com o teto e o sorteio preso ao
+    teto pelo bind, que é o que o SkipList._random_level usa.
+    """
+
+    MEASUREMENT_PATH = "measurements"
+    MAX_LEVELS = [4, 16, 32]
+    NUMBER = 200_000
+    NUM_RUNS = 25
+
+    print("Iniciando medição do sorteio de levels...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+    for max_level in MAX_LEVELS:
+        generator = GeometricLevels(0.5, Random(SEED))
+        skiplist = SkipList(max_level=max_level, seed=SEED)
+        draws = {
+            'laço random()': LoopLevels(0.5, max_level)._random_level,
+            'GeometricLevels': lambda: generator(max_level),
+            'SkipList._random_level': skiplist._random_level,
+        }
+
+        print(f"\n--- max_level={max_level} ---")
+        for name, elapsed in measure(draws, NUMBER, NUM_RUNS).items():
+            print(f"   -> {name:<24}: {elapsed:.1f} ns/chamada")
+            all_results.append({'max_level': max_level, 'draw': name,
+                                'ns_per_call': elapsed})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "skiplist_level_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['max_level', 'draw', 'ns_per_call'])
+            writer.writeheader()
+            writer.writerows(all_results)
+
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ def measure_insertion(data: List[int]) -> float:
     """Mede o tempo para inserir todos os elementos de uma amostra em uma SkipList vazia."""
     start_time = time.perf_counter()
     
-    sl = SkipList()
+    sl = SkipList(multimap=True) # mantém as repetidas, como as árvores
     for item in data:
         sl.insert(item, item) # Usando o próprio item como chave e valor
         
@@ -35,7 +35,7 @@ def measure_deletion(data: List[int], populated_list: SkipList) -> float:
     start_time = time.perf_counter()
     
     for item in data:
-        list_to_delete.delete(item)
+        list_to_delete.delete_one(item)
         
     end_time = time.perf_counter()
     return (end_time - start_time) * 1000 # Retorna em milissegundos
@@ -83,7 +83,7 @@ def main():
             
             insertion_times, search_times, deletion_times = [], [], []
             
-            populated_skiplist = SkipList()
+            populated_skiplist = SkipList(multimap=True)
             for item in data:
                 populated_skiplist.insert(item, item)
 
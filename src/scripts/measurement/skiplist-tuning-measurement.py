@@ -0,0 +1,202 @@
+import os
+import time
+import copy
+import csv
+import tracemalloc
+from math import e
+from typing import List, Dict
+
+from src.edas.skiplist import SkipList
+
+SEED = 42
+
+
+def build(data: List[int], p: float, max_level: int) -> SkipList:
+    """Monta uma SkipList com a configuração indicada e todos os elementos da amostra."""
+    sl = SkipList(max_level=max_level, p=p, seed=SEED, multimap=True)
+    for item in data:
+        sl.insert(item, item)
+    return sl
+
+def measure_insertion(data: List[int], p: float, max_level: int) -> float:
+    """Mede o tempo para inserir todos os elementos de uma amostra em uma SkipList vazia."""
+    start_time = time.perf_counter()
+    build(data, p, max_level)
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_search(data: List[int], populated_list: SkipList) -> float:
+    """Mede o tempo para buscar todos os elementos de uma amostra em uma SkipList pré-populada."""
+    start_time = time.perf_counter()
+    
+    for item in data:
+        populated_list.search(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_deletion(data: List[int], populated_list: SkipList) -> float:
+    """Mede o tempo para deletar todos os elementos de uma amostra, usando uma cópia da lista."""
+    list_to_delete = copy.copy(populated_list)
+    
+    start_time = time.perf_counter()
+    
+    for item in data:
+        list_to_delete.delete_one(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_memory(data: List[int], p: float, max_level: int) -> int:
+    """Bytes alocados pela SkipList montada, medidos com o tracemalloc."""
+    tracemalloc.start()
+    sl = build(data, p, max_level)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sl
+    return allocated
+
+def save_results(results: List[Dict], measurement_path: str) -> None:
+    """
+    Os tempos de cada configuração vão para um CSV no mesmo formato dos
+    outros resultados (sample_type, size, operation, time_ms), dentro de
+    skiplist_tuning/, para entrarem nos plots como uma estrutura a mais.
+    A memória, que tem uma linha por configuração e não por operação,
+    fica em um CSV à parte junto com p e max_level.
+    """
+    tuning_path = os.path.join(measurement_path, "skiplist_tuning")
+    os.makedirs(tuning_path, exist_ok=True)
+
+    configs: Dict[tuple, List[Dict]] = {}
+    memory_rows = {}
+    for row in results:
+        config = (row['p'], row['max_level'])
+        configs.setdefault(config, []).append({key: row[key] for key in
+                                               ('sample_type', 'size', 'operation', 'time_ms')})
+        memory_rows[(row['sample_type'], row['size']) + config] = {
+            key: row[key] for key in ('sample_type', 'size', 'p', 'max_level', 'memory_bytes')}
+
+    for (p_label, max_level), rows in configs.items():
+        csv_path = os.path.join(tuning_path, f"p{p_label.replace('/', '-')}_L{max_level}_results.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'operation', 'time_ms'])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    csv_path = os.path.join(tuning_path, "memory.csv")
+    print(f"\nSalvando tempos por configuração e memória em '{tuning_path}'...")
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'p', 'max_level', 'memory_bytes'])
+        writer.writeheader()
+        writer.writerows(memory_rows.values())
+
+def recommend(results: List[Dict], target_size: int) -> Dict:
+    """
+    Escolhe a configuração com o menor tempo total (inserção, busca e deleção)
+    no tamanho medido mais próximo de target_size; a memória desempata.
+    """
+    closest = min({row['size'] for row in results}, key=lambda size: abs(size - target_size))
+    totals: Dict[tuple, List[float]] = {}
+
+    for row in results:
+        if row['size'] != closest:
+            continue
+        config = (row['p'], row['max_level'])
+        total = totals.setdefault(config, [0.0, row['memory_bytes']])
+        total[0] += row['time_ms']
+
+    (p, max_level), (time_ms, memory) = min(totals.items(), key=lambda item: (item[1][0], item[1][1]))
+    return {'size': closest, 'p': p, 'max_level': max_level,
+            'time_ms': time_ms, 'memory_bytes': memory}
+
+
+def main():
+    """
+    Varre uma grade de p e max_level para cada tamanho de amostra, medindo
+    inserção, busca, deleção e memória, e recomenda a melhor configuração
+    para o tamanho alvo (TARGET_SIZE, por padrão a maior amostra).
+    """
+
+    SAMPLE_PATH = os.getenv("SAMPLE_RELATIVE_PATH", "samples")
+    MEASUREMENT_PATH = "measurements"
+    SAMPLE_FILES = ["samples-sequential.txt", "samples-random.txt"]
+    P_VALUES = {'1/2': 1 / 2, '1/e': 1 / e, '1/4': 1 / 4, '1/8': 1 / 8}
+    MAX_LEVELS = [4, 8, 16, 32]
+    NUM_RUNS = 5
+
+    print("Iniciando varredura de p e max_level da SkipList...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+
+    for filename in SAMPLE_FILES:
+        sample_type = "sequential" if "sequential" in filename else "random"
+        filepath = os.path.join(SAMPLE_PATH, filename)
+        
+        print(f"\n{'='*50}")
+        print(f"Processando arquivo de amostras: {filename}")
+        print(f"{'='*50}")
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"ERRO: Arquivo de amostra não encontrado em '{filepath}'.")
+            continue
+
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            data = [int(x) for x in line.strip().split()]
+            sample_size = len(data)
+
+            print(f"\n--- Medindo Amostra {sample_type.capitalize()} (Tamanho: {sample_size}) ---")
+
+            for p_label, p in P_VALUES.items():
+                for max_level in MAX_LEVELS:
+                    insertion_times, search_times, deletion_times = [], [], []
+                    populated_skiplist = build(data, p, max_level)
+
+                    for i in range(NUM_RUNS):
+                        insertion_times.append(measure_insertion(data, p, max_level))
+                        search_times.append(measure_search(data, populated_skiplist))
+                        deletion_times.append(measure_deletion(data, populated_skiplist))
+
+                    memory = measure_memory(data, p, max_level)
+                    averages = {'insertion': sum(insertion_times) / NUM_RUNS,
+                                'search': sum(search_times) / NUM_RUNS,
+                                'deletion': sum(deletion_times) / NUM_RUNS}
+
+                    print(f"   -> p={p_label:<3} max_level={max_level:<2}: "
+                          f"inserção {averages['insertion']:.4f} ms, busca {averages['search']:.4f} ms, "
+                          f"deleção {averages['deletion']:.4f} ms, memória {memory / 1024:.1f} KiB")
+
+                    for operation, avg_time in averages.items():
+                        all_results.append({'sample_type': sample_type, 'size': sample_size,
+                                            'p': p_label, 'max_level': max_level,
+                                            'operation': operation, 'time_ms': avg_time,
+                                            'memory_bytes': memory})
+
+    if all_results:
+        save_results(all_results, MEASUREMENT_PATH)
+        print("Resultados salvos com sucesso!")
+
+        target_size = int(os.getenv("TARGET_SIZE", max(row['size'] for row in all_results)))
+        for sample_type in ("sequential", "random"):
+            rows = [row for row in all_results if row['sample_type'] == sample_type]
+            if not rows:
+                continue
+            best = recommend(rows, target_size)
+            print(f"\nRecomendação para n≈{target_size} ({sample_type}, medido em n={best['size']}): "
+                  f"p={best['p']}, max_level={best['max_level']} "
+                  f"({best['time_ms']:.4f} ms no total, {best['memory_bytes'] / 1024:.1f} KiB)")
+    else:
+        print("\nNenhum resultado foi gerado. Verifique os arquivos de amostra.")
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
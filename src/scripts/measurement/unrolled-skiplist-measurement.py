@@ -0,0 +1,181 @@
+import os
+import time
+import copy
+import csv
+import random
+import tracemalloc
+from typing import List
+
+from src.edas.skiplist import SkipList
+from src.edas.unrolled_skiplist import UnrolledSkipList
+
+SEED = 42
+
+
+
+def measure_insertion(data: List[int]) -> float:
+    """Mede o tempo para inserir todos os elementos de uma amostra em uma UnrolledSkipList vazia."""
+    start_time = time.perf_counter()
+    
+    sl = UnrolledSkipList()
+    for item in data:
+        sl.insert(item, item) # Usando o próprio item como chave e valor
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_search(data: List[int], populated_list: UnrolledSkipList) -> float:
+    """Mede o tempo para buscar todos os elementos de uma amostra em uma UnrolledSkipList pré-populada."""
+    start_time = time.perf_counter()
+    
+    for item in data:
+        populated_list.search(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def measure_deletion(data: List[int], populated_list: UnrolledSkipList) -> float:
+    """Mede o tempo para deletar todos os elementos de uma amostra, usando uma cópia da lista."""
+    list_to_delete = copy.copy(populated_list)
+    
+    start_time = time.perf_counter()
+    
+    for item in data:
+        list_to_delete.delete(item)
+        
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000 # Retorna em milissegundos
+
+def build(structure, data: List[int]):
+    """Monta a estrutura inserindo os elementos um a um."""
+    sl = structure()
+    for item in data:
+        sl.insert(item, item)
+    return sl
+
+def measure_memory(structure, data: List[int]) -> int:
+    """Bytes alocados pela estrutura montada, medidos com o tracemalloc."""
+    tracemalloc.start()
+    sl = build(structure, data)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sl
+    return allocated
+
+def measure_memory_sizes(measurement_path: str) -> None:
+    """
+    Compara a memória por chave da UnrolledSkipList (blocos com listas
+    paralelas de chaves e valores) com a SkipList (um Node por chave), até
+    1M de inteiros aleatórios. Vai para um CSV próprio para não mudar o
+    formato do de tempos.
+    """
+    sizes = [int(x) for x in os.getenv("UNROLLED_MEMORY_SIZES", "10000 100000 1000000").split()]
+    structures = {'SkipList': lambda: SkipList(adaptive=True), 'UnrolledSkipList': UnrolledSkipList}
+
+    results = []
+    rng = random.Random(SEED)
+
+    for size in sizes:
+        data = rng.sample(range(size * 10), size)
+
+        print(f"\n--- Memória com {size} inteiros aleatórios ---")
+
+        for name, structure in structures.items():
+            memory = measure_memory(structure, data)
+            print(f"   -> {name:<16}: {memory / size:.1f} bytes/chave")
+            results.append({'structure': name, 'size': size, 'memory_bytes': memory,
+                            'bytes_per_key': memory / size})
+
+    csv_path = os.path.join(measurement_path, "unrolled_skiplist_memory.csv")
+    print(f"\nSalvando medições de memória em '{csv_path}'...")
+
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=['structure', 'size', 'memory_bytes', 'bytes_per_key'])
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main():
+    """
+    Função principal que carrega as amostras, executa os testes e salva os resultados.
+    """
+
+    SAMPLE_PATH = os.getenv("SAMPLE_RELATIVE_PATH", "samples")
+    MEASUREMENT_PATH = "measurements"
+    SAMPLE_FILES = ["samples-sequential.txt", "samples-random.txt"]
+    NUM_RUNS = 5 
+
+    print("Iniciando medição de performance da UnrolledSkipList...")
+
+    os.makedirs(MEASUREMENT_PATH, exist_ok=True)
+
+    all_results = []
+
+    for filename in SAMPLE_FILES:
+        sample_type = "sequential" if "sequential" in filename else "random"
+        filepath = os.path.join(SAMPLE_PATH, filename)
+        
+        print(f"\n{'='*50}")
+        print(f"Processando arquivo de amostras: {filename}")
+        print(f"{'='*50}")
+
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"ERRO: Arquivo de amostra não encontrado em '{filepath}'.")
+            continue
+
+        for line in lines:
+            if not line.strip():
+                continue
+            
+            data = [int(x) for x in line.strip().split()]
+            sample_size = len(data)
+
+            print(f"\n--- Medindo Amostra {sample_type.capitalize()} (Tamanho: {sample_size}) ---")
+            
+            insertion_times, search_times, deletion_times = [], [], []
+            
+            populated_unrolled = UnrolledSkipList()
+            for item in data:
+                populated_unrolled.insert(item, item)
+
+            for i in range(NUM_RUNS):
+                print(f"   -> Execução {i+1}/{NUM_RUNS}...")
+                insertion_times.append(measure_insertion(data))
+                search_times.append(measure_search(data, populated_unrolled))
+                deletion_times.append(measure_deletion(data, populated_unrolled))
+            
+            avg_insertion = sum(insertion_times) / NUM_RUNS
+            avg_search = sum(search_times) / NUM_RUNS
+            avg_deletion = sum(deletion_times) / NUM_RUNS
+
+            print(f"   -> Média Inserção: {avg_insertion:.4f} ms")
+            print(f"   -> Média Busca:    {avg_search:.4f} ms")
+            print(f"   -> Média Deleção:  {avg_deletion:.4f} ms")
+            
+            all_results.append({'sample_type': sample_type, 'size': sample_size, 'operation': 'insertion', 'time_ms': avg_insertion})
+            all_results.append({'sample_type': sample_type, 'size': sample_size, 'operation': 'search', 'time_ms': avg_search})
+            all_results.append({'sample_type': sample_type, 'size': sample_size, 'operation': 'deletion', 'time_ms': avg_deletion})
+
+    if all_results:
+        csv_path = os.path.join(MEASUREMENT_PATH, "unrolled_skiplist_results.csv")
+        print(f"\nSalvando resultados consolidados em '{csv_path}'...")
+        
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=['sample_type', 'size', 'operation', 'time_ms'])
+            writer.writeheader()
+            writer.writerows(all_results)
+        
+        print("Resultados salvos com sucesso!")
+    else:
+        print("\nNenhum resultado foi gerado. Verifique os arquivos de amostra.")
+
+    measure_memory_sizes(MEASUREMENT_PATH)
+
+    print("\nProcesso de medição finalizado!")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file